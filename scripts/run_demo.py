@@ -8,13 +8,23 @@ Requirements:
   - `pip install -r requirements.txt`
   - Environment: `OPENAI_API_KEY` (required), `OPENAI_MODEL` (optional; defaults
     to `gpt-4o-mini`).
+
+Offline classification via the OpenAI Batch API (50% token price, ≤24h):
+  python scripts/run_demo.py --batch interactions.jsonl   # submit; prints batch id
+  python scripts/run_demo.py --batch-status <batch_id> --batch interactions.jsonl
+Each JSONL line is an `Interaction` (at least `{"text": ...}`).
 """
 
+import argparse
+import asyncio
+import json
+
 from src.core.types import Interaction
 from src.agent.router import AgentRouter
 from src.adapters.datasource.json_data_source import JSONDataSource
 from src.adapters.policy.null_policy import NullPolicyEngine
 from src.adapters.telemetry.print_sink import PrintSink
+from src.adapters.telemetry.buffered_sink import BufferedSink
 from src.adapters.executor.local_executor import LocalExecutor
 from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
 from src.adapters.llm.openai_provider import OpenAIProvider
@@ -32,7 +42,39 @@ except Exception:
     pass
 
 
-def main() -> None:
+def _load_interactions(path: str) -> list[Interaction]:
+    """Read one `Interaction` per non-empty JSONL line."""
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run_batch(path: str, batch_status: str | None) -> None:
+    """Submit `path` for offline classification, or report on an existing batch.
+
+    With `batch_status`, prints the batch status and, once completed, the
+    `(intent_id, params)` pair for each line of `path`.
+    """
+    interactions = _load_interactions(path)
+    intents = YAMLIntentsRegistry("config/intents.yaml")
+    eligible = intents.get_eligible({"channel": "chat"})
+    llm = OpenAIProvider(model="gpt-4o-mini")
+    classifier = LLMIntentClassifier(llm)
+
+    if not batch_status:
+        batch_id = classifier.classify_offline(interactions, eligible)
+        print({"batch_id": batch_id, "submitted": len(interactions)})
+        return
+
+    status = llm.poll_batch(batch_status)
+    print({"batch": status})
+    if status["status"] != "completed":
+        return
+    results = classifier.collect_offline(batch_status, len(interactions), eligible)
+    for interaction, (intent, params) in zip(interactions, results):
+        print({"text": interaction.get("text", ""), "intent_id": intent.get("id") if intent else None, "params": params})
+
+
+async def main() -> None:
     """Wire components and run a single interaction end-to-end.
 
     This demo intentionally keeps dependencies minimal so you can see each
@@ -42,10 +84,11 @@ def main() -> None:
     ds = JSONDataSource("data/orders.json")
     executor = LocalExecutor()
     executor.register("check_order_status", make_check_order_status(ds))
+    executor.freeze()
 
     # Policies and telemetry
     policy = NullPolicyEngine()
-    telemetry = PrintSink()
+    telemetry = BufferedSink(PrintSink())
 
     # Intents + classifier (LLM-based via OpenAI)
     intents = YAMLIntentsRegistry("config/intents.yaml")
@@ -71,9 +114,23 @@ def main() -> None:
         "customer_id": "C-1",
         "context": {"session_id": "s-1", "channel": "chat"},
     }
-    response = router.handle(interaction)
+    # `ahandle` awaits the LLM call; batch many interactions with `asyncio.gather`.
+    try:
+        response = await router.ahandle(interaction)
+    finally:
+        # Release the provider's async connections before `asyncio.run` closes the loop.
+        await llm.aclose()
     print({"agent_response": response})
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Run the CX agent demo or an offline batch classification.")
+    parser.add_argument("--batch", metavar="FILE", help="JSONL of interactions to classify via the Batch API")
+    parser.add_argument("--batch-status", metavar="BATCH_ID", help="poll (and fetch, when done) a submitted batch")
+    args = parser.parse_args()
+    if args.batch_status and not args.batch:
+        parser.error("--batch-status requires --batch FILE (the interactions that were submitted)")
+    if args.batch:
+        run_batch(args.batch, args.batch_status)
+    else:
+        asyncio.run(main())
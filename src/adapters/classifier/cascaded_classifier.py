@@ -0,0 +1,58 @@
+from __future__ import annotations
+"""Cascaded intent classifier.
+
+Runs a cheap `fast` classifier first and only falls back to the expensive
+`slow` one (typically `LLMIntentClassifier`) when the fast result is not
+conclusive. Messages the fast path fully resolves skip the LLM round-trip.
+"""
+import asyncio
+from typing import Dict, List, Tuple
+
+from src.core.interfaces import IntentClassifier
+from src.core.types import Interaction, Intent
+
+
+class CascadedClassifier(IntentClassifier):
+    """Classify with `fast`; defer to `slow` unless `fast` filled every required param.
+
+    A fast result is accepted only when it names an intent and its params
+    cover all of that intent's `required_params`. Anything less (unknown
+    intent, partial params) goes to `slow`.
+    """
+
+    def __init__(self, fast: IntentClassifier, slow: IntentClassifier) -> None:
+        """Store the fast (first) and slow (fallback) classifiers."""
+        self.fast = fast
+        self.slow = slow
+        # Expose the slow classifier's LLM so the router can draft clarifications.
+        self.llm = getattr(slow, "llm", None)
+
+    def classify(
+        self, interaction: Interaction, intents: List[Intent], history: List[dict]
+    ) -> Tuple[Intent | None, Dict]:
+        """Return the fast result when conclusive, else the slow classifier's result."""
+        intent, params = self.fast.classify(interaction, intents, history)
+        if _is_conclusive(intent, params):
+            return intent, params
+        return self.slow.classify(interaction, intents, history)
+
+    async def aclassify(
+        self, interaction: Interaction, intents: List[Intent], history: List[dict]
+    ) -> Tuple[Intent | None, Dict]:
+        """Async variant: the fast path runs inline, the slow path is awaited."""
+        intent, params = self.fast.classify(interaction, intents, history)
+        if _is_conclusive(intent, params):
+            return intent, params
+        aclassify = getattr(self.slow, "aclassify", None)
+        if aclassify is not None:
+            return await aclassify(interaction, intents, history)
+        return await asyncio.to_thread(self.slow.classify, interaction, intents, history)
+
+
+def _is_conclusive(intent: Intent | None, params: Dict) -> bool:
+    """True when an intent was chosen and all its required params are present."""
+    if not intent:
+        return False
+    required = intent.get("required_params", []) or []
+    params = params or {}
+    return all(params.get(p) for p in required)
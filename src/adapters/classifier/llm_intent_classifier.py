@@ -1,10 +1,53 @@
 from __future__ import annotations
-from typing import List, Tuple, Dict
+import asyncio
+from typing import Callable, List, Tuple, Dict
+
+try:
+    # Optional: generates a native-Python validator from the schema once.
+    import fastjsonschema  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None  # type: ignore
 
 from src.core.interfaces import IntentClassifier, LLMProvider
 from src.core.types import Interaction, Intent
 
 
+# Shape every provider result must have before we trust `intent_id`/`params`.
+_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent_id": {"type": ["string", "null"]},
+        "params": {"type": ["object", "null"]},
+    },
+    "required": ["intent_id"],
+}
+
+
+def _is_valid_result(result: object) -> bool:
+    """Hand-written equivalent of `_RESULT_SCHEMA` (used without fastjsonschema)."""
+    if not isinstance(result, dict) or "intent_id" not in result:
+        return False
+    intent_id = result["intent_id"]
+    params = result.get("params")
+    return (intent_id is None or isinstance(intent_id, str)) and (params is None or isinstance(params, dict))
+
+
+def _compile_result_validator() -> Callable[[object], bool]:
+    """Return a predicate for `_RESULT_SCHEMA`, compiled once per classifier."""
+    if fastjsonschema is None:
+        return _is_valid_result
+    validate = fastjsonschema.compile(_RESULT_SCHEMA)
+
+    def _check(result: object) -> bool:
+        try:
+            validate(result)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return _check
+
+
 class LLMIntentClassifier(IntentClassifier):
     """Classifies the user's intent and extracts parameters using an LLM provider.
 
@@ -15,11 +58,21 @@ class LLMIntentClassifier(IntentClassifier):
     Provider contract:
       - Returns a JSON-like dict: {"intent_id", "params", "missing_params", "confidence"}.
       - When the provider supports it, we request JSON mode via `response_format`.
+      - Results are validated against `_RESULT_SCHEMA` before use.
+
+    `aclassify` is the async variant used by `AgentRouter.ahandle`.
     """
 
+    # Distinct eligible-intent sets are few (roughly one per channel); bound the memo anyway.
+    _MAX_CACHED_INTENT_SETS = 64
+
     def __init__(self, llm: LLMProvider) -> None:
         """Store the low-level LLM provider used for classification."""
         self.llm = llm
+        # (intent ids...) -> (prompt fragment, {intent_id: intent}). Eligible sets rarely
+        # change between requests, so the prompt text and lookup index are built once.
+        self._intent_sets: Dict[tuple, Tuple[str, Dict[str, Intent]]] = {}
+        self._is_valid = _compile_result_validator()
 
     def classify(
         self, interaction: Interaction, intents: List[Intent], history: List[dict]
@@ -30,31 +83,161 @@ class LLMIntentClassifier(IntentClassifier):
         asks the provider for JSON, and maps the `intent_id` back to the full
         intent definition.
         """
-        # Build a minimal system/user prompt. In real usage, you'd provide a JSON schema
-        # or function-calling definition. Our FakeLLMProvider returns a structured dict.
-        intents_desc = [
-            f"- {it.get('id')}: {it.get('description')} (params: {it.get('required_params')})"
-            for it in intents
+        messages = self._build_messages(interaction, intents)
+        # Ask the provider for JSON output so parsing is reliable.
+        result = self.llm.generate(messages, response_format={"type": "json_object"})
+        return self._resolve(result, intents)
+
+    async def aclassify(
+        self, interaction: Interaction, intents: List[Intent], history: List[dict]
+    ) -> Tuple[Intent | None, Dict]:
+        """Coroutine twin of `classify` for concurrent use (e.g., `asyncio.gather`).
+
+        Uses the provider's `agenerate` when available; otherwise runs the sync
+        `generate` in a worker thread so the event loop is never blocked.
+        """
+        messages = self._build_messages(interaction, intents)
+        response_format = {"type": "json_object"}
+        agenerate = getattr(self.llm, "agenerate", None)
+        if agenerate is not None:
+            result = await agenerate(messages, response_format=response_format)
+        else:
+            result = await asyncio.to_thread(self.llm.generate, messages, response_format)
+        return self._resolve(result, intents)
+
+    def classify_batch(
+        self,
+        interactions: List[Interaction],
+        intents: List[Intent],
+        history: List[dict] | None = None,
+        batch_size: int = 10,
+    ) -> List[Tuple[Intent | None, Dict]]:
+        """Classify many interactions with one LLM call per `batch_size` chunk.
+
+        Intended for offline workloads (evals, backfills). The instructions and
+        intent list are sent once per chunk instead of once per message, cutting
+        N round-trips to ceil(N / batch_size). Tradeoff: accuracy can degrade as
+        more messages share a prompt, so keep `batch_size` small (5–10) and use
+        `classify` for live traffic. Results are returned in input order; items
+        the model omits or garbles resolve to `(None, {})`.
+        """
+        results: List[Tuple[Intent | None, Dict]] = []
+        for start in range(0, len(interactions), max(1, batch_size)):
+            chunk = interactions[start : start + max(1, batch_size)]
+            messages = self._build_batch_messages(chunk, intents)
+            result = self.llm.generate(messages, response_format={"type": "json_object"})
+            items = result.get("classifications") if isinstance(result, dict) else None
+            if not isinstance(items, list):
+                items = []
+            for i in range(len(chunk)):
+                item = items[i] if i < len(items) and isinstance(items[i], dict) else {}
+                results.append(self._resolve(item, intents))
+        return results
+
+    def classify_offline(self, interactions: List[Interaction], intents: List[Intent]) -> str:
+        """Submit one classification request per interaction via the Batch API.
+
+        Returns the batch id; pass it to `collect_offline` once the batch has
+        completed (up to 24h). Requires a provider with `submit_batch`
+        (e.g., `OpenAIProvider`).
+        """
+        submit_batch = getattr(self.llm, "submit_batch", None)
+        if submit_batch is None:
+            raise RuntimeError("LLM provider does not support batch submission")
+        requests = [
+            {"custom_id": str(i), "messages": self._build_messages(interaction, intents)}
+            for i, interaction in enumerate(interactions)
         ]
-        messages = [
+        return submit_batch(requests)
+
+    def collect_offline(
+        self, batch_id: str, count: int, intents: List[Intent]
+    ) -> List[Tuple[Intent | None, Dict]]:
+        """Fetch a completed offline batch and map results back to input order.
+
+        `count` is the number of interactions submitted; missing or failed
+        items resolve to `(None, {})`.
+        """
+        results = self.llm.fetch_batch_results(batch_id)  # type: ignore[attr-defined]
+        return [self._resolve(results.get(str(i)) or {}, intents) for i in range(count)]
+
+    # --- Helpers ---
+
+    def _intents_block(self, intents: List[Intent]) -> str:
+        """Return the eligible intents rendered as a system-prompt fragment."""
+        return self._intent_set(intents)[0]
+
+    def _build_messages(self, interaction: Interaction, intents: List[Intent]) -> List[dict]:
+        """Build the classification prompt: instructions, user text, eligible intents."""
+        # Build a minimal system/user prompt. In real usage, you'd provide a JSON schema
+        # or function-calling definition.
+        return [
             {
                 "role": "system",
                 "content": (
                     "You are a classifier. Pick an intent from the provided list and extract required parameters."
                 ),
             },
-            {"role": "user", "content": interaction.get("text", "")},
+            {"role": "user", "content": interaction["text"]},
+            {"role": "system", "content": self._intents_block(intents)},
+        ]
+
+    def _build_batch_messages(self, interactions: List[Interaction], intents: List[Intent]) -> List[dict]:
+        """Build one prompt that classifies several numbered user messages at once."""
+        numbered = "\n".join(
+            f"{i}. {it.get('text', '')}" for i, it in enumerate(interactions, start=1)
+        )
+        return [
             {
                 "role": "system",
-                "content": "Eligible intents:\n" + "\n".join(intents_desc),
+                "content": (
+                    "You are a classifier. For each numbered message, pick an intent from the provided list "
+                    "and extract required parameters. Respond with a JSON object "
+                    '{"classifications": [{"intent_id": ..., "params": {...}}, ...]} '
+                    "containing exactly one entry per message, in the same order."
+                ),
             },
+            {
+                "role": "user",
+                "content": "Classify each of the following numbered messages:\n" + numbered,
+            },
+            {"role": "system", "content": self._intents_block(intents)},
         ]
 
-        # Ask the provider for JSON output so parsing is reliable.
-        result = self.llm.generate(messages, response_format={"type": "json_object"})
+    def _resolve(self, result: dict, intents: List[Intent]) -> Tuple[Intent | None, Dict]:
+        """Map the provider's JSON result to `(intent, params)`.
+
+        Results that fail schema validation (missing/ill-typed `intent_id` or
+        `params`) are treated as "no intent": `(None, {})`.
+        """
+        if not self._is_valid(result):
+            return None, {}
         intent_id = result.get("intent_id")
         params = result.get("params", {}) or {}
 
-        # Map intent_id back to the full intent object
-        intent = next((it for it in intents if it.get("id") == intent_id), None)
+        # Map intent_id back to the full intent object (only eligible intents qualify)
+        intent = self._intent_index(intents).get(intent_id) if isinstance(intent_id, str) else None
         return intent, params
+
+    def _intent_index(self, intents: List[Intent]) -> Dict[str, Intent]:
+        """Return an id → intent dict for this eligible set."""
+        return self._intent_set(intents)[1]
+
+    def _intent_set(self, intents: List[Intent]) -> Tuple[str, Dict[str, Intent]]:
+        """Return `(prompt fragment, id index)` for `intents`, memoized by their ids."""
+        key = tuple(it.get("id") for it in intents)
+        entry = self._intent_sets.get(key)
+        if entry is None:
+            if len(self._intent_sets) >= self._MAX_CACHED_INTENT_SETS:
+                self._intent_sets.clear()
+            lines = [
+                f"- {it.get('id')}: {it.get('description')} (params: {it.get('required_params')})"
+                for it in intents
+            ]
+            index: Dict[str, Intent] = {}
+            for it in intents:
+                # setdefault keeps the first match on duplicate ids, like the old scan did
+                index.setdefault(it.get("id"), it)
+            entry = ("Eligible intents:\n" + "\n".join(lines), index)
+            self._intent_sets[key] = entry
+        return entry
@@ -0,0 +1,216 @@
+from __future__ import annotations
+"""Semantic cache in front of an intent classifier.
+
+Embeds each user message and reuses an earlier `(intent, params)` decision
+when a previous message is close enough (cosine similarity ≥ `threshold`) and
+was classified against the same eligible-intent set. Paraphrased repeats
+("where's my order O-1" / "where is order O-1?") then skip the LLM call.
+
+Requires `numpy`. The default encoder is `sentence-transformers`
+(`all-MiniLM-L6-v2`, 384-dim, a few ms per message on CPU); pass any
+`encoder(text) -> vector` callable to use something else. When `numba` is
+installed, the best-match scan runs as a compiled kernel instead of a NumPy
+matrix-vector product plus `argmax`.
+"""
+import asyncio
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    njit = None  # type: ignore
+
+from src.core.interfaces import IntentClassifier
+from src.core.types import Interaction, Intent
+
+_DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+def _top1_numpy(vectors, query, count: int) -> Tuple[int, float]:
+    """Index and cosine score of the best of the first `count` rows (NumPy)."""
+    sims = vectors[:count] @ query
+    best = int(np.argmax(sims))
+    return best, float(sims[best])
+
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _top1_kernel(vectors, query, count):  # pragma: no cover - compiled
+        # Serial on purpose: a parallel argmax would race on `best`/`best_i`.
+        best_i = 0
+        best = -2.0
+        dim = query.shape[0]
+        for i in range(count):
+            s = 0.0
+            for j in range(dim):
+                s += vectors[i, j] * query[j]
+            if s > best:
+                best = s
+                best_i = i
+        return best_i, best
+
+    def _top1(vectors, query, count: int) -> Tuple[int, float]:
+        """Index and cosine score of the best of the first `count` rows (Numba)."""
+        best_i, best = _top1_kernel(vectors, query, count)
+        return int(best_i), float(best)
+
+else:
+    _top1 = _top1_numpy
+
+
+def _default_encoder() -> Callable[[str], Sequence[float]]:
+    """Load the default sentence-transformers model (raises if not installed)."""
+    try:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "sentence-transformers not available. Install it or pass `encoder=` to SemanticCacheClassifier."
+        ) from e
+    model = SentenceTransformer(_DEFAULT_MODEL)
+    return lambda text: model.encode(text, normalize_embeddings=True)
+
+
+def _compile_param_patterns(intent: Intent) -> Tuple[Tuple[str, re.Pattern[str]], ...]:
+    """Compile the intent's `param_mapping` regexes; invalid patterns are skipped."""
+    compiled = []
+    for name, pattern in (intent.get("param_mapping") or {}).items():
+        try:
+            compiled.append((name, re.compile(pattern)))
+        except (re.error, TypeError):
+            continue
+    return tuple(compiled)
+
+
+def _compile_value_patterns(params: Dict) -> Tuple[re.Pattern[str], ...]:
+    """Whole-token regexes for the non-empty param values (so `O-1` does not match `O-12345`)."""
+    return tuple(re.compile(rf"(?<!\w){re.escape(str(v))}(?!\w)") for v in params.values() if v)
+
+
+def _params_match(text: str, params: Dict, value_res, patterns) -> bool:
+    """True when the cached params are consistent with the entities in `text`."""
+    for rx in value_res:
+        if rx.search(text) is None:
+            return False
+    for name, rx in patterns:
+        m = rx.search(text)
+        if m is not None and str(params.get(name)) != m.group(0):
+            return False
+    return True
+
+
+class SemanticCacheClassifier(IntentClassifier):
+    """Reuse classifications of semantically similar earlier messages.
+
+    - `inner`: classifier consulted on a cache miss.
+    - `encoder`: maps text to an embedding; vectors are L2-normalized here.
+    - `threshold`: minimum cosine similarity for a hit.
+    - `capacity`: cached messages; the oldest is overwritten when full.
+
+    Only decisions that chose an intent are cached. A hit is also rejected
+    unless every cached param value appears in the new message as a whole token
+    and every param the intent's `param_mapping` patterns find in the new
+    message equals the cached value. A similar sentence with a different (or
+    newly added) order id is therefore re-classified.
+    """
+
+    def __init__(
+        self,
+        inner: IntentClassifier,
+        encoder: Callable[[str], Sequence[float]] | None = None,
+        threshold: float = 0.9,
+        capacity: int = 1024,
+    ) -> None:
+        """Wrap `inner`; the embedding matrix is allocated on first insert."""
+        if np is None:
+            raise RuntimeError("numpy not available. Install 'numpy' to use SemanticCacheClassifier.")
+        self.inner = inner
+        # Expose the inner classifier's LLM so the router can draft clarifications.
+        self.llm = getattr(inner, "llm", None)
+        self.encoder = encoder or _default_encoder()
+        self.threshold = threshold
+        self.capacity = capacity
+        self._vectors = None  # (capacity, dim) float32, preallocated lazily
+        # Row i of `_vectors` -> (intent, params, eligible_key, compiled param-value regexes)
+        self._meta: List[Tuple[Intent, Dict, tuple, Tuple[re.Pattern[str], ...]]] = []
+        # intent_id -> compiled `param_mapping` patterns, built on first store
+        self._param_patterns: Dict[str, Tuple[Tuple[str, re.Pattern[str]], ...]] = {}
+        self._next = 0  # ring-buffer write position
+        self._lock = threading.Lock()
+
+    def classify(
+        self, interaction: Interaction, intents: List[Intent], history: List[dict]
+    ) -> Tuple[Intent | None, Dict]:
+        """Return a cached decision for a similar message, else classify via `inner`."""
+        query, eligible_key, hit = self._lookup(interaction, intents)
+        if hit is not None:
+            return hit
+        intent, params = self.inner.classify(interaction, intents, history)
+        self._store(query, eligible_key, intent, params)
+        return intent, params
+
+    async def aclassify(
+        self, interaction: Interaction, intents: List[Intent], history: List[dict]
+    ) -> Tuple[Intent | None, Dict]:
+        """Async variant; the embedding lookup runs in a worker thread so it does not block the loop."""
+        query, eligible_key, hit = await asyncio.to_thread(self._lookup, interaction, intents)
+        if hit is not None:
+            return hit
+        aclassify = getattr(self.inner, "aclassify", None)
+        if aclassify is not None:
+            intent, params = await aclassify(interaction, intents, history)
+        else:
+            intent, params = await asyncio.to_thread(self.inner.classify, interaction, intents, history)
+        self._store(query, eligible_key, intent, params)
+        return intent, params
+
+    def _lookup(self, interaction: Interaction, intents: List[Intent]):
+        """Embed the message and return `(query, eligible_key, hit_or_None)`."""
+        text = interaction["text"]
+        query = np.asarray(self.encoder(text), dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(query))
+        if norm > 0.0:
+            query = query / norm
+        eligible_key = tuple(it.get("id") for it in intents)
+        with self._lock:
+            count = len(self._meta)
+            if count == 0 or self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+                return query, eligible_key, None
+            best, score = _top1(self._vectors, query, count)
+            intent, params, cached_key, value_res = self._meta[best]
+            patterns = self._param_patterns.get(intent.get("id", ""), ())
+        if score < self.threshold or cached_key != eligible_key:
+            return query, eligible_key, None
+        if not _params_match(text, params, value_res, patterns):
+            return query, eligible_key, None
+        return query, eligible_key, (intent, dict(params))
+
+    def _store(self, query, eligible_key: tuple, intent: Optional[Intent], params: Dict) -> None:
+        """Record a conclusive decision in the next ring-buffer slot."""
+        if not intent:
+            return
+        params = dict(params or {})
+        value_res = _compile_value_patterns(params)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+                self._vectors = np.empty((self.capacity, query.shape[0]), dtype=np.float32)
+                self._meta = []
+                self._next = 0
+            row = self._next
+            self._vectors[row] = query
+            intent_id = intent.get("id", "")
+            if intent_id not in self._param_patterns:
+                self._param_patterns[intent_id] = _compile_param_patterns(intent)
+            entry = (intent, params, eligible_key, value_res)
+            if row < len(self._meta):
+                self._meta[row] = entry
+            else:
+                self._meta.append(entry)
+            self._next = (row + 1) % self.capacity
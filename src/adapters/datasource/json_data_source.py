@@ -3,23 +3,55 @@ from __future__ import annotations
 
 Loads a local JSON file containing a list of order dicts and exposes a simple
 lookup by `order_id`. Intended for demos and tests.
+
+Parsing starts on a background thread at construction so the first
+`get_order` call does not pay for it; `orjson` is used when installed.
 """
 import json
+import threading
 from pathlib import Path
 from typing import Optional
+
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    _orjson = None
+
 from src.core.interfaces import DataSource
 
 
+def _parse_json_bytes(raw: bytes):
+    """Parse JSON bytes with orjson when available, else the stdlib."""
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
 class JSONDataSource(DataSource):
     """Read-only data source backed by a JSON file."""
-    def __init__(self, orders_path: str | Path) -> None:
+    def __init__(self, orders_path: str | Path, preload: bool = True) -> None:
+        """Remember the file path and, if `preload`, start parsing it in the background."""
         self.orders_path = Path(orders_path)
-        self._orders = None
+        self._orders: Optional[dict] = None
+        # Serializes loading so a lookup racing the preload waits instead of parsing twice.
+        self._load_lock = threading.Lock()
+        if preload:
+            threading.Thread(target=self._preload, name="json-data-source-load", daemon=True).start()
+
+    def _preload(self) -> None:
+        # Errors are deliberately swallowed here; `get_order` retries and raises them.
+        try:
+            self._load()
+        except Exception:
+            pass
 
     def _load(self) -> None:
-        if self._orders is None:
-            with self.orders_path.open() as f:
-                self._orders = {o["order_id"]: o for o in json.load(f)}
+        if self._orders is not None:
+            return
+        with self._load_lock:
+            if self._orders is None:
+                raw = self.orders_path.read_bytes()
+                self._orders = {o["order_id"]: o for o in _parse_json_bytes(raw)}
 
     def get_order(self, order_id: str) -> dict | None:
         """Return an order dict by id or None if not found."""
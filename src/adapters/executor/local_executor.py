@@ -3,25 +3,125 @@ from __future__ import annotations
 
 Maintains an in-process registry of tool handlers (callables) keyed by name
 and invokes them with validated parameters from the policy stage.
+
+Handlers may be plain functions or coroutine functions. From async code use
+`aexecute` (or `execute_many` for a batch): coroutines are awaited directly and
+sync handlers run in worker threads, so independent lookups overlap instead of
+queuing. Sync `execute` drives an async handler with `asyncio.run` and so only
+works when no event loop is running in the calling thread.
+
+After registration, `freeze()` locks the registry into a read-only mapping.
 """
+import asyncio
+import inspect
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional, Tuple
+
 from src.core.interfaces import ToolExecutor
 from src.core.types import ToolResult, ToolCall
 
+# Shared (frozen) result for calls naming an unregistered tool.
+_UNKNOWN_TOOL = ToolResult(ok=False, error="unknown_tool")
+
 
 class LocalExecutor(ToolExecutor):
+    __slots__ = ("_handlers", "_frozen")
+
     def __init__(self) -> None:
-        self._handlers: dict[str, callable] = {}
+        self._handlers: Mapping[str, Callable] = {}
+        self._frozen = False
 
     def register(self, tool_name: str, handler) -> None:
-        self._handlers[tool_name] = handler
+        if self._frozen:
+            raise RuntimeError("LocalExecutor is frozen; register tools before freeze()")
+        self._handlers[tool_name] = handler  # type: ignore[index]
+
+    def freeze(self) -> None:
+        """Make the registry read-only; later `register` calls raise."""
+        self._handlers = MappingProxyType(dict(self._handlers))
+        self._frozen = True
 
     def execute(self, call: ToolCall) -> ToolResult:
         """Invoke the registered tool handler for the given call.
 
-        Returns a structured `ToolResult` with either `ok=True, data=...` or
+        Accepts a `ToolCall` or a legacy `{"tool_name", "params"}` dict. Returns
+        a structured `ToolResult` with either `ok=True, data=...` or
         `ok=False, error=...`.
         """
-        fn = self._handlers.get(call["tool_name"])  # type: ignore
+        fn, params = self._resolve(call)
         if not fn:
-            return {"ok": False, "error": "unknown_tool"}
-        return fn(call.get("params", {}))
+            return _UNKNOWN_TOOL
+        return self._invoke(fn, params)
+
+    def _resolve(self, call: ToolCall | dict) -> Tuple[Optional[Callable], dict]:
+        """Find the handler for `call` by tool name."""
+        if isinstance(call, ToolCall):
+            return self._handlers.get(call.tool_name), call.params
+        return self._handlers.get(call["tool_name"]), call.get("params", {})
+
+    def _invoke(self, fn: Callable, params: dict) -> ToolResult:
+        """Call a handler synchronously and normalize its result.
+
+        Raises RuntimeError for an async handler when an event loop is already
+        running in this thread; use `aexecute` there instead.
+        """
+        result = fn(params)
+        if inspect.isawaitable(result):
+            if _loop_running():
+                close = getattr(result, "close", None)
+                if close is not None:
+                    close()  # avoid a "never awaited" warning
+                raise RuntimeError(
+                    "async tool handler called via execute() inside a running event loop; "
+                    "use `await executor.aexecute(call)` instead"
+                )
+            # Async handler called from sync code (no running loop): drive it to completion.
+            result = asyncio.run(result)
+        return _as_tool_result(result)
+
+    async def execute_many(self, calls: List[ToolCall]) -> List[ToolResult]:
+        """Execute several calls concurrently and return results in call order.
+
+        A handler that raises yields `ToolResult(ok=False, error=repr(exc))`
+        instead of failing the whole batch.
+        """
+        results = await asyncio.gather(*(self.aexecute(c) for c in calls), return_exceptions=True)
+        out: List[ToolResult] = []
+        for r in results:
+            if isinstance(r, Exception):
+                out.append(ToolResult(ok=False, error=repr(r)))
+            elif isinstance(r, BaseException):  # e.g., cancellation: propagate
+                raise r
+            else:
+                out.append(r)
+        return out
+
+    async def aexecute(self, call: ToolCall) -> ToolResult:
+        """Async variant of `execute`: runs one call without blocking the event loop."""
+        fn, params = self._resolve(call)
+        if not fn:
+            return _UNKNOWN_TOOL
+        if inspect.iscoroutinefunction(fn):
+            result = await fn(params)
+        else:
+            result = await asyncio.to_thread(fn, params)
+            # e.g. an object with `async def __call__`, or a sync function returning an awaitable
+            if inspect.isawaitable(result):
+                result = await result
+        return _as_tool_result(result)
+
+
+def _loop_running() -> bool:
+    """True when the calling thread is inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _as_tool_result(result: Any) -> ToolResult:
+    """Normalize handler output: dict-returning handlers are wrapped in `ToolResult`."""
+    if isinstance(result, dict):
+        return ToolResult(ok=bool(result.get("ok", False)), data=result.get("data"), error=result.get("error"))
+    return result
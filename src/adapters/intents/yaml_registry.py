@@ -5,38 +5,67 @@ Reads `config/intents.yaml` and returns intents that are eligible for the given
 context (e.g., filters by channel). This keeps intent definitions in config so
 you can adjust rollout or parameter rules without code changes.
 """
+import sys
 from typing import List, Dict, Any
 from pathlib import Path
 import yaml
 
+try:
+    # libyaml C binding: much faster than the pure-Python loader on startup.
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YAMLLoader
+
 from src.core.interfaces import IntentsRegistry
 from src.core.types import Intent
 
 
 class YAMLIntentsRegistry(IntentsRegistry):
     """Loads intents from a YAML file and applies simple eligibility filters."""
+    __slots__ = ("path", "_intents", "_by_channel", "_unrestricted")
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
         self._intents: List[Intent] = []
+        # channel -> eligible intents (YAML order); `_unrestricted` serves unknown channels.
+        self._by_channel: Dict[str, List[Intent]] = {}
+        self._unrestricted: List[Intent] = []
         self._load()
 
     def _load(self) -> None:
-        data = yaml.safe_load(self.path.read_text()) or {}
+        data = yaml.load(self.path.read_text(), Loader=_YAMLLoader) or {}
         intents = data.get("intents", [])
+        for it in intents:
+            # Interned so the eligible-set keys built from ids downstream (the LLM
+            # classifier's per-set memo, the semantic cache's eligible_key) compare
+            # by identity; each id's hash is computed once, on first use there.
+            if isinstance(it.get("id"), str):
+                it["id"] = sys.intern(it["id"])
         self._intents = intents
+        self._build_eligibility_index(intents)
+
+    def _build_eligibility_index(self, intents: List[Intent]) -> None:
+        """Precompute eligible intents per channel so lookups skip the filter loop."""
+        restricted = [(it, _channels_of(it)) for it in intents]
+        known_channels = {ch for _, chans in restricted if chans for ch in chans}
+        self._unrestricted = [it for it, chans in restricted if not chans]
+        self._by_channel = {
+            ch: [it for it, chans in restricted if not chans or ch in chans]
+            for ch in known_channels
+        }
 
     def get_eligible(self, context: dict) -> List[Intent]:
         """Return intents eligible for the provided context.
 
-        Currently supports filtering by `constraints.channels`.
+        Currently supports filtering by `constraints.channels`; the per-channel
+        lists are precomputed at load time and returned as-is (no copy), so
+        callers must not mutate the result.
         """
         channel = (context or {}).get("channel", "chat")
-        eligible: List[Intent] = []
-        for it in self._intents:
-            constraints: Dict[str, Any] = it.get("constraints", {}) or {}
-            channels = constraints.get("channels")
-            if channels and channel not in channels:
-                continue
-            # rollout, tiers can be added later; assume eligible
-            eligible.append(it)
-        return eligible
+        # rollout, tiers can be added later; assume eligible
+        return self._by_channel.get(channel, self._unrestricted)
+
+
+def _channels_of(intent: Intent) -> List[str] | None:
+    """Return the intent's channel allow-list, or None when unrestricted."""
+    constraints: Dict[str, Any] = intent.get("constraints", {}) or {}
+    return constraints.get("channels") or None
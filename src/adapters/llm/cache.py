@@ -0,0 +1,84 @@
+from __future__ import annotations
+"""Content-addressed cache for LLM responses.
+
+Providers key each request by a SHA-256 digest of `(model, messages,
+response_format, temperature)` and consult the cache before calling the
+network. Identical classification requests (retries, duplicate user messages,
+eval reruns) then skip the round-trip and token cost entirely. Only
+deterministic requests (temperature 0) are worth caching: replaying one sampled
+reply for every later call would silently remove the sampling.
+
+The default backend is an in-process LRU with an optional TTL. Swap in a
+shared backend (e.g., Redis) by implementing the same `get`/`set` methods.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, Any]],
+    response_format: Dict | None,
+    temperature: float | None = None,
+) -> str:
+    """Return a stable SHA-256 hex digest for an LLM request."""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "response_format": response_format,
+        "temperature": temperature,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """In-memory LRU cache of provider results with optional expiry.
+
+    - `max_entries`: evicts least-recently-used entries beyond this size.
+    - `ttl_seconds`: entries older than this are treated as misses (None = never expire).
+
+    Cached dicts are shared between hits; callers must treat them as read-only.
+    Thread-safe: sync `generate` may run on worker threads (e.g., via
+    `asyncio.to_thread`) while other callers use the same cache.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (stored_at, result); ordered oldest → most recently used
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached result for `key`, or None on miss/expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: str, result: dict) -> None:
+        """Store `result` under `key`, evicting the LRU entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -5,34 +5,172 @@ Implements the `LLMProvider` interface using the OpenAI Python SDK. Supports
 both the Responses API and Chat Completions API, falling back automatically to
 whichever is available in the installed SDK version. When JSON mode is
 requested, attempts to return a parsed object; otherwise returns raw text.
+
+`generate` is synchronous; `agenerate` is the coroutine twin backed by
+`AsyncOpenAI` so callers can overlap many requests with `asyncio.gather`. A
+semaphore caps in-flight async requests to stay under provider rate limits.
+The async client (with its pooled `httpx` connections) and the semaphore are
+bound to the event loop that first uses them. Await `aclose()` before that
+loop ends to release the connections; a later `agenerate` on a different loop
+builds a fresh client rather than reusing the dead one.
+
+Pass an `LLMCache` (with `temperature=0`) to skip the network for repeated
+identical requests.
+
+For large offline jobs (evals, labeling), `submit_batch` / `poll_batch` /
+`fetch_batch_results` use the OpenAI Batch API: results arrive within 24h at
+half the token price and with much higher rate limits.
 """
 
 import os
 import json
-from typing import Any, Dict, List
+import asyncio
+import importlib.util
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    # Rust/SIMD JSON parser; the stdlib is the fallback.
+    import orjson as _orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    _orjson = None
 
 try:
     # OpenAI Python SDK >= 1.0
-    from openai import OpenAI  # type: ignore
+    from openai import OpenAI, AsyncOpenAI  # type: ignore
 except Exception:  # pragma: no cover - import-time guard
     OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
+
+try:
+    # Installed alongside the OpenAI SDK; used for a tuned async connection pool.
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - import-time guard
+    httpx = None  # type: ignore
 
 from src.core.interfaces import LLMProvider
+from src.core.types import ToolCall
+from src.adapters.llm.cache import LLMCache, make_cache_key
+
+
+# httpx only negotiates HTTP/2 when the optional `h2` package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _new_async_http_client() -> Any:
+    """Return a pooled `httpx.AsyncClient` (None without httpx).
+
+    Concurrent `agenerate` calls multiplex over its keep-alive (HTTP/2 when
+    available) connections. It belongs to the loop that first uses it.
+    """
+    if httpx is None:
+        return None
+    return httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+        timeout=30.0,
+    )
+
+
+def _json_loads(text: str | bytes) -> Any:
+    """Parse JSON with orjson when available, else the stdlib."""
+    if _orjson is not None:
+        return _orjson.loads(text)
+    return json.loads(text)
+
+
+# Precomputed role headers so the common roles avoid a format per message.
+_ROLE_TAGS = {"system": "[system]\n", "user": "[user]\n", "assistant": "[assistant]\n"}
 
 
 def _to_prompt_str(messages: List[Dict[str, Any]]) -> str:
+    """Flatten chat messages into "[role]" header + content blocks separated by blank lines."""
     parts: List[str] = []
-    for m in messages:
+    ap = parts.append
+    for i, m in enumerate(messages):
+        if i:
+            ap("\n\n")
         role = m.get("role", "user")
+        ap(_ROLE_TAGS.get(role) or f"[{role}]\n")
         content = m.get("content", "")
-        parts.append(f"[{role}]\n{content}")
-    return "\n\n".join(parts)
+        ap(content if isinstance(content, str) else str(content))
+    return "".join(parts)
+
+
+def _parse_responses_output(resp: Any, force_json: bool) -> dict:
+    """Extract a dict from a Responses API result (parsed JSON, JSON text, or raw)."""
+    if getattr(resp, "output_parsed", None):  # JSON mode success
+        return resp.output_parsed  # type: ignore[attr-defined]
+    # Fallback to text extraction
+    try:
+        text = resp.output[0].content[0].text  # type: ignore[attr-defined]
+    except Exception:
+        text = None
+    # Try to parse JSON if requested
+    if force_json and isinstance(text, str):
+        try:
+            return _json_loads(text)
+        except Exception:
+            pass
+    return {"raw": text}
+
+
+def _parse_chat_output(comp: Any, force_json: bool) -> dict:
+    """Extract a dict from a Chat Completions result (JSON text or raw)."""
+    text = None
+    try:
+        text = comp.choices[0].message.content  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    if force_json and isinstance(text, str):
+        try:
+            return _json_loads(text)
+        except Exception:
+            pass
+    return {"raw": text}
+
+
+def _parse_batch_record(record: Dict[str, Any]) -> dict:
+    """Extract a `generate`-style dict from one Batch API output line."""
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code", 200) != 200:
+        return {"raw": None, "error": record.get("error") or response.get("body")}
+    try:
+        text = response["body"]["choices"][0]["message"]["content"]
+    except Exception:
+        return {"raw": None}
+    if isinstance(text, str):
+        try:
+            return _json_loads(text)
+        except Exception:
+            pass
+    return {"raw": text}
+
+
+def _to_chat_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Normalize messages to the `{role, content}` shape Chat Completions expects."""
+    return [{"role": m.get("role", "user"), "content": m.get("content", "")} for m in messages]
 
 
 class OpenAIProvider(LLMProvider):
     """Concrete LLM provider for OpenAI with graceful API fallback."""
 
-    def __init__(self, model: str | None = None) -> None:
+    def __init__(
+        self,
+        model: str | None = None,
+        max_concurrent_requests: int = 32,
+        cache: LLMCache | None = None,
+        temperature: float | None = None,
+    ) -> None:
+        """Create sync + async SDK clients for `model`.
+
+        `max_concurrent_requests` bounds how many `agenerate` calls may be in
+        flight at once per event loop; extra callers wait on the semaphore.
+        `temperature` is sent with every request (None = the API default). When
+        `cache` is given, successful results are memoized by request content;
+        this requires `temperature=0`, since sampled replies must not be replayed.
+        """
+        if cache is not None and temperature != 0:
+            raise ValueError("cache requires temperature=0; sampled replies are not cacheable")
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is required for OpenAIProvider")
@@ -42,37 +180,99 @@ class OpenAIProvider(LLMProvider):
             )
         self.client = OpenAI()
         self.model = model or os.getenv("OPENAI_MODEL") or "gpt-4o-mini"
+        self.max_concurrent_requests = max_concurrent_requests
+        # (loop, AsyncOpenAI client, httpx client, semaphore) for the loop in use;
+        # created by the first `agenerate`, released by `aclose`.
+        self._async_state: Optional[Tuple[asyncio.AbstractEventLoop, Any, Any, asyncio.Semaphore]] = None
+        self.cache = cache
+        self.temperature = temperature
 
     def generate(self, messages: List[Dict[str, Any]], response_format: Dict | None = None) -> dict:
         """Call OpenAI and return structured output when possible.
 
+        - Serves from `self.cache` when an identical request was answered before.
         - Prefers Responses API with JSON mode when available.
         - Falls back to Chat Completions API with JSON mode if supported.
         - As a last resort, returns a dict with a `raw` text field.
         """
+        if self.cache is None:
+            return self._generate_uncached(messages, response_format)
+        key = make_cache_key(self.model, messages, response_format, self.temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = self._generate_uncached(messages, response_format)
+        self._cache_store(key, result)
+        return result
+
+    async def agenerate(self, messages: List[Dict[str, Any]], response_format: Dict | None = None) -> dict:
+        """Async counterpart of `generate` using `AsyncOpenAI`.
+
+        Shares the cache with `generate` and follows the same Responses → Chat
+        Completions → `{"raw": None}` fallback order. Concurrency is bounded by
+        the provider's semaphore.
+        """
+        if self.cache is None:
+            return await self._agenerate_uncached(messages, response_format)
+        key = make_cache_key(self.model, messages, response_format, self.temperature)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        result = await self._agenerate_uncached(messages, response_format)
+        self._cache_store(key, result)
+        return result
+
+    def _loop_async_state(self) -> Tuple[Any, asyncio.Semaphore]:
+        """Return the async client and semaphore for the running loop, creating them if needed.
+
+        State left over from another loop is dropped, not reused: its
+        connections belong to that loop (call `aclose()` there to release them).
+        """
+        loop = asyncio.get_running_loop()
+        state = self._async_state
+        if state is None or state[0] is not loop:
+            http_client = _new_async_http_client()
+            aclient = AsyncOpenAI(http_client=http_client) if http_client is not None else AsyncOpenAI()
+            state = self._async_state = (loop, aclient, http_client, asyncio.Semaphore(self.max_concurrent_requests))
+        return state[1], state[3]
+
+    async def aclose(self) -> None:
+        """Close the async client and its connections; await before the event loop ends.
+
+        Safe to call repeatedly; the next `agenerate` opens a new client.
+        """
+        state, self._async_state = self._async_state, None
+        if state is None:
+            return
+        _, aclient, http_client, _ = state
+        close = getattr(aclient, "close", None)
+        if close is not None:
+            await close()
+        if http_client is not None:
+            await http_client.aclose()
+
+    def _sampling_kwargs(self) -> Dict[str, Any]:
+        """Request kwargs for the configured temperature (empty for the API default)."""
+        return {} if self.temperature is None else {"temperature": self.temperature}
+
+    def _cache_store(self, key: str, result: dict) -> None:
+        """Cache `result` unless it is the give-up fallback (retry those next time)."""
+        if self.cache is None or not isinstance(result, dict):
+            return
+        if result.get("raw", True) is not None:
+            self.cache.set(key, result)
+
+    def _generate_uncached(self, messages: List[Dict[str, Any]], response_format: Dict | None) -> dict:
+        """Blocking SDK call with API fallbacks (see `generate`)."""
         force_json = bool(response_format)
 
         # 1) Try Responses API (SDKs that support `response_format`)
         try:
             if hasattr(self.client, "responses"):
                 prompt = _to_prompt_str(messages)
-                kwargs: Dict[str, Any] = {"model": self.model, "input": prompt}
+                kwargs: Dict[str, Any] = {"model": self.model, "input": prompt, **self._sampling_kwargs()}
                 resp = self.client.responses.create(**kwargs)  # type: ignore[arg-type]
-
-                if getattr(resp, "output_parsed", None):  # JSON mode success
-                    return resp.output_parsed  # type: ignore[attr-defined]
-                # Fallback to text extraction
-                try:
-                    text = resp.output[0].content[0].text  # type: ignore[attr-defined]
-                except Exception:
-                    text = None
-                # Try to parse JSON if requested
-                if force_json and isinstance(text, str):
-                    try:
-                        return json.loads(text)
-                    except Exception:
-                        pass
-                return {"raw": text}
+                return _parse_responses_output(resp, force_json)
         except TypeError:
             # Older SDK may not accept `response_format` here; fall through
             pass
@@ -83,29 +283,111 @@ class OpenAIProvider(LLMProvider):
         # 2) Try Chat Completions API
         try:
             if hasattr(self.client, "chat") and hasattr(self.client.chat, "completions"):
-                chat_messages = [
-                    {"role": m.get("role", "user"), "content": m.get("content", "")}
-                    for m in messages
-                ]
-                kwargs = {"model": self.model, "messages": chat_messages}
+                kwargs = {"model": self.model, "messages": _to_chat_messages(messages), **self._sampling_kwargs()}
                 # Older SDKs do not support `response_format`; rely on prompting and parse.
                 comp = self.client.chat.completions.create(**kwargs)  # type: ignore[arg-type]
-                text = None
-                try:
-                    text = comp.choices[0].message.content  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-                if force_json and isinstance(text, str):
-                    try:
-                        return json.loads(text)
-                    except Exception:
-                        pass
-                return {"raw": text}
+                return _parse_chat_output(comp, force_json)
         except Exception:
             pass
 
         # 3) Give up with a clear fallback
         return {"raw": None}
 
+    async def _agenerate_uncached(self, messages: List[Dict[str, Any]], response_format: Dict | None) -> dict:
+        """Non-blocking SDK call with API fallbacks (see `agenerate`)."""
+        if AsyncOpenAI is None:
+            # SDK without an async client: keep the event loop free by using a worker thread.
+            return await asyncio.to_thread(self._generate_uncached, messages, response_format)
+        force_json = bool(response_format)
+        aclient, semaphore = self._loop_async_state()
+
+        async with semaphore:
+            # 1) Try Responses API
+            try:
+                if hasattr(aclient, "responses"):
+                    prompt = _to_prompt_str(messages)
+                    kwargs: Dict[str, Any] = {"model": self.model, "input": prompt, **self._sampling_kwargs()}
+                    resp = await aclient.responses.create(**kwargs)  # type: ignore[arg-type]
+                    return _parse_responses_output(resp, force_json)
+            except Exception:
+                # Non-fatal; try chat completions next
+                pass
+
+            # 2) Try Chat Completions API
+            try:
+                if hasattr(aclient, "chat") and hasattr(aclient.chat, "completions"):
+                    kwargs = {"model": self.model, "messages": _to_chat_messages(messages), **self._sampling_kwargs()}
+                    comp = await aclient.chat.completions.create(**kwargs)  # type: ignore[arg-type]
+                    return _parse_chat_output(comp, force_json)
+            except Exception:
+                pass
+
+        # 3) Give up with a clear fallback
+        return {"raw": None}
+
+    # --- Batch API (offline jobs) ---
+
+    def submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """Upload requests as a Batch API job and return the batch id.
+
+        Each request is `{"messages": [...], "custom_id"?: str}`; `custom_id`
+        defaults to the request's index. Requests are sent to
+        `/v1/chat/completions` with this provider's model. Like `generate`, no
+        `response_format` is forwarded; JSON output is parsed from the text.
+        """
+        lines: List[str] = []
+        for i, req in enumerate(requests):
+            body = {"model": self.model, "messages": _to_chat_messages(req.get("messages", []))}
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": str(req.get("custom_id", i)),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        upload = self.client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> dict:
+        """Return `{id, status, output_file_id, error_file_id, request_counts}` for a batch."""
+        batch = self.client.batches.retrieve(batch_id)
+        counts = getattr(batch, "request_counts", None)
+        return {
+            "id": batch.id,
+            "status": batch.status,
+            "output_file_id": getattr(batch, "output_file_id", None),
+            "error_file_id": getattr(batch, "error_file_id", None),
+            "request_counts": counts.model_dump() if hasattr(counts, "model_dump") else counts,
+        }
+
+    def fetch_batch_results(self, batch_id: str) -> Dict[str, dict]:
+        """Download a completed batch and return `{custom_id: result}`.
+
+        Each result is parsed like `generate` output: a JSON object when the
+        model returned JSON, else `{"raw": text}`. Failed requests map to
+        `{"raw": None, "error": ...}`. Raises `RuntimeError` if the batch has
+        no output yet.
+        """
+        status = self.poll_batch(batch_id)
+        if not status["output_file_id"]:
+            raise RuntimeError(f"batch {batch_id} has no output yet (status: {status['status']})")
+        text = self.client.files.content(status["output_file_id"]).text
+        results: Dict[str, dict] = {}
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            results[str(record.get("custom_id"))] = _parse_batch_record(record)
+        return results
+
     def route(self, interaction, history):  # pragma: no cover - unused
-        return {"tool_name": "", "params": {}}
+        return ToolCall(tool_name="", params={})
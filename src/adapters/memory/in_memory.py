@@ -2,49 +2,86 @@ from __future__ import annotations
 """In-memory conversation memory.
 
 Provides a simple per-session memory handle that stores:
-- `history`: list of messages (dicts)
+- `history`: bounded deque of messages (dicts); the oldest entry is evicted on append.
+  Messages without a `timestamp` are stamped with a UTC ISO-8601 time on append.
 - `params`: accumulated intent parameters across turns
 - `waiting`: name of the parameter the agent is waiting for (if any)
 
 Intended for local development and tests. Swap with a SQLite-backed provider
 without changing Router code by preserving the `SessionMemoryHandle` interface.
+
+At most `max_sessions` sessions stay resident; the least recently used one is
+evicted past that cap. Evicted sessions are simply dropped: a turn may still
+hold their handle, so they are never reassigned to another session. Sessions
+removed explicitly with `discard` are cleared and kept on a small free-list,
+so bursts of short-lived sessions reuse objects instead of re-allocating them.
 """
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from src.core.interfaces import ConversationMemory, SessionMemoryHandle
 
 
-@dataclass
+@lru_cache(maxsize=2)
+def _second_prefix(second: int) -> str:
+    """Format whole seconds once; calls within the same second hit the cache."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601 with microseconds, e.g. `2024-01-01T00:00:00.000000Z`."""
+    t = time.time()
+    s = int(t)
+    return f"{_second_prefix(s)}.{int((t - s) * 1e6):06d}Z"
+
+
+@dataclass(slots=True)
 class _Session(SessionMemoryHandle):
     session_id: str
     max_messages: int = 10
-    _history: List[dict] = field(default_factory=list)
+    _history: Deque[dict] = field(init=False)
     _params: Dict[str, str] = field(default_factory=dict)
     _waiting: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # A bounded deque enforces the cap on append in O(1) (no list re-slicing).
+        self._history = deque(maxlen=self.max_messages if self.max_messages > 0 else None)
+
     def history(self) -> List[dict]:
         return list(self._history)
 
     def append(self, message: dict) -> None:
+        # Stamps `message` in place (no copy); callers pass freshly built dicts.
+        if "timestamp" not in message:
+            message["timestamp"] = _now_iso()
         self._history.append(message)
-        self.prune(self.max_messages)
 
     def params(self) -> Dict[str, str]:
         return dict(self._params)
 
     def merge(self, params: Dict[str, str]) -> None:
-        self._params.update(params or {})
+        if not params:
+            return
+        self._params.update(params)
 
     def waiting(self) -> str | None:
         return self._waiting
 
+    def snapshot(self) -> Tuple[int, Tuple[str, ...], str | None]:
+        # (history length, param names, waiting param) without copying history.
+        return len(self._history), tuple(self._params), self._waiting
+
     def set_waiting(self, name: str | None) -> None:
         self._waiting = name
 
     def prune(self, max_messages: int = 10) -> None:
-        if max_messages > 0 and len(self._history) > max_messages:
-            # Keep the most recent `max_messages` entries
-            self._history = self._history[-max_messages:]
+        # Keep the most recent `max_messages` entries (append already enforces `self.max_messages`)
+        if max_messages > 0:
+            while len(self._history) > max_messages:
+                self._history.popleft()
 
     def clear(self) -> None:
         self._history.clear()
@@ -52,19 +89,79 @@ class _Session(SessionMemoryHandle):
         self._waiting = None
 
 
+class _SessionPool:
+    """Free-list of cleared `_Session` objects reused for new sessions.
+
+    Keeps at most `max_free` idle objects. Not locked itself: the owning
+    memory calls it while holding its own lock.
+    """
+
+    def __init__(self, max_messages: int, max_free: int = 128) -> None:
+        self._max_messages = max_messages
+        self._max_free = max_free
+        self._free: List[_Session] = []
+
+    def acquire(self, session_id: str) -> _Session:
+        """Return an empty session for `session_id`, recycled when possible."""
+        sesh = self._free.pop() if self._free else None
+        if sesh is None:
+            return _Session(session_id=session_id, max_messages=self._max_messages)
+        sesh.session_id = session_id
+        return sesh
+
+    def release(self, sesh: _Session) -> None:
+        """Clear `sesh` and keep it for reuse (dropped when the pool is full)."""
+        sesh.clear()
+        if len(self._free) < self._max_free:
+            self._free.append(sesh)
+
+
 class InMemoryConversationMemory(ConversationMemory):
     """Simple in-process memory implementation.
 
-    Stores session state in a dict; not suitable for multi-process or long-term
-    persistence, but fast and dependency-free for development.
+    Stores session state in an LRU-ordered dict; not suitable for multi-process
+    or long-term persistence, but fast and dependency-free for development.
+    Session lookup is thread-safe (one router may serve several UI threads).
+
+    - `max_messages`: per-session history cap.
+    - `max_sessions`: resident session cap (None = unbounded). Evicted sessions
+      lose their state; a handle still held to one keeps working but is detached
+      and never shared with another session.
     """
 
-    def __init__(self, max_messages: int = 10) -> None:
+    __slots__ = ("_max_messages", "_max_sessions", "_sessions", "_pool", "_lock")
+
+    def __init__(self, max_messages: int = 10, max_sessions: int | None = 10_000) -> None:
         self._max_messages = max_messages
-        self._sessions: Dict[str, _Session] = {}
+        self._max_sessions = max_sessions
+        # session_id -> session; ordered least → most recently used
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._pool = _SessionPool(max_messages)
+        # Guards `_sessions` and `_pool`.
+        self._lock = threading.Lock()
 
     def for_session(self, session_id: str) -> SessionMemoryHandle:
-        if session_id not in self._sessions:
-            self._sessions[session_id] = _Session(session_id=session_id, max_messages=self._max_messages)
-        return self._sessions[session_id]
+        with self._lock:
+            # One lookup on the (common) hit path; insert only on a miss.
+            sesh = self._sessions.get(session_id)
+            if sesh is not None:
+                self._sessions.move_to_end(session_id)
+                return sesh
+            sesh = self._sessions[session_id] = self._pool.acquire(session_id)
+            if self._max_sessions is not None:
+                while len(self._sessions) > self._max_sessions:
+                    # Not recycled: an in-flight turn may still hold this handle.
+                    self._sessions.popitem(last=False)
+            return sesh
+
+    def discard(self, session_id: str) -> None:
+        """Forget `session_id` entirely and recycle its state.
+
+        Handles previously returned for this session must not be used after
+        this call: the object may be reassigned to a new session.
+        """
+        with self._lock:
+            sesh = self._sessions.pop(session_id, None)
+            if sesh is not None:
+                self._pool.release(sesh)
 
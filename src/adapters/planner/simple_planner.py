@@ -10,8 +10,20 @@ from typing import List
 from src.core.interfaces import Planner
 from src.core.types import Intent, Interaction, Plan, Respond, ToolCall, AskUser
 
+# Message templates; only the `order_id` variants need formatting per call.
+_PRE_WITH = "I’ll check the status of order {oid}."
+_PRE_WITHOUT = "I’ll check your order status."
+_POST_WITH = "Here’s what I found for order {oid}: {{summary}}"
+_POST_WITHOUT = "Here’s what I found: {summary}"
+
+# Step kinds of the two plan shapes this planner emits.
+_ASK_KINDS = ("ask_user",)
+_TOOL_KINDS = ("respond", "tool_call", "respond")
+
 
 class SimplePlanner(Planner):
+    __slots__ = ()
+
     def plan(self, intent: Intent, interaction: Interaction, params: dict) -> Plan:
         """Create a minimal plan: Respond(pre) → ToolCall → Respond(post).
 
@@ -30,29 +42,45 @@ class SimplePlanner(Planner):
             prompt = (
                 "What is your order ID?" if param == "order_id" else f"What is your {param}?"
             )
-            steps.append(AskUser(type="ask_user", param=param, prompt=prompt))
-            return Plan(intent_id=intent_id, steps=steps)
+            ask = AskUser(param=param, prompt=prompt)
+            steps.append(ask)
+            return Plan(
+                intent_id=intent_id,
+                steps=steps,
+                pre=None,
+                tool=None,
+                post=None,
+                ask=ask,
+                step_kinds=_ASK_KINDS,
+            )
 
         # Pre-respond
         order_id = params.get("order_id")
-        pre_msg = (
-            f"I’ll check the status of order {order_id}."
-            if order_id
-            else "I’ll check your order status."
-        )
-        steps.append(Respond(type="respond", when="pre", message=pre_msg))
+        if order_id:
+            pre_msg = _PRE_WITH.format(oid=order_id)
+            post_msg = _POST_WITH.format(oid=order_id)
+        else:
+            pre_msg = _PRE_WITHOUT
+            post_msg = _POST_WITHOUT
+        pre = Respond(when="pre", message=pre_msg)
+        steps.append(pre)
 
-        # Tool step
+        # Tool step. `params` is a fresh copy from the router and is not
+        # mutated afterwards, so it is passed through without re-copying.
         tool_name = intent.get("tool") or ""
-        tool_params = {**params}
-        steps.append(ToolCall(tool_name=tool_name, params=tool_params))
+        tool = ToolCall(tool_name=tool_name, params=params)
+        steps.append(tool)
 
         # Post-respond template (planner does not know result yet)
-        post_msg = (
-            f"Here’s what I found for order {order_id}: {{summary}}"
-            if order_id
-            else "Here’s what I found: {summary}"
-        )
-        steps.append(Respond(type="respond", when="post", message=post_msg))
+        post = Respond(when="post", message=post_msg)
+        steps.append(post)
 
-        return Plan(intent_id=intent_id, steps=steps)
+        return Plan(
+            intent_id=intent_id,
+            steps=steps,
+            pre=pre,
+            tool=tool,
+            post=post,
+            ask=None,
+            step_kinds=_TOOL_KINDS,
+        )
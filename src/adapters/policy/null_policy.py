@@ -7,10 +7,18 @@ or approvals.
 from src.core.interfaces import PolicyEngine
 from src.core.types import ToolCall, Interaction, PolicyDecision
 
+# Shared, constant decision; `reasons` is a tuple so the instance cannot be
+# mutated through one caller and observed by the next.
+_ALLOW = PolicyDecision(allowed=True, reasons=())
+
 
 class NullPolicyEngine(PolicyEngine):
     """Accept-all policy for early development and tests."""
+    __slots__ = ()
 
     def validate(self, call: ToolCall, interaction: Interaction, history: list[dict]) -> PolicyDecision:
-        """Always returns allowed=True; does not inspect inputs."""
-        return PolicyDecision(allowed=True, reasons=[])
+        """Always returns allowed=True; does not inspect inputs.
+
+        The same decision object is returned on every call; treat it as read-only.
+        """
+        return _ALLOW
@@ -0,0 +1,64 @@
+from __future__ import annotations
+"""Buffering telemetry sink.
+
+Wraps another `TelemetrySink`: `record` only queues the event and `flush`
+hands the queued events to the inner sink in one go. The router flushes at
+the end of every `handle`, so a turn's 6-8 events become a single write (one
+stdout write for `PrintSink`, one request for a future HTTP sink).
+
+`max_pending` bounds the queue for callers that do not flush per turn, and
+`close()` delivers whatever is left at shutdown.
+"""
+import threading
+from typing import List
+from src.core.interfaces import TelemetrySink
+from src.core.types import TelemetryEvent
+
+
+class BufferedSink(TelemetrySink):
+    """Queue events in memory and forward them to `inner` on `flush`.
+
+    If `inner` provides `record_many(events)`, a flush is one call; otherwise
+    events are forwarded one by one. Safe to share across threads and tasks:
+    a flush delivers every event queued so far, in arrival order.
+
+    - `max_pending`: flush automatically once this many events are queued
+      (None = only on `flush`/`close`).
+    """
+
+    __slots__ = ("inner", "max_pending", "_pending", "_lock")
+
+    def __init__(self, inner: TelemetrySink, max_pending: int | None = None) -> None:
+        """Wrap `inner`, the sink that receives flushed events."""
+        self.inner = inner
+        self.max_pending = max_pending
+        self._pending: List[TelemetryEvent] = []
+        self._lock = threading.Lock()
+
+    def record(self, event: TelemetryEvent) -> None:
+        """Queue `event` until the next `flush` (or until `max_pending` is reached)."""
+        with self._lock:
+            self._pending.append(event)
+            full = self.max_pending is not None and len(self._pending) >= self.max_pending
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Forward all queued events to the inner sink and clear the queue."""
+        with self._lock:
+            if not self._pending:
+                return
+            events, self._pending = self._pending, []
+        record_many = getattr(self.inner, "record_many", None)
+        if record_many is not None:
+            record_many(events)
+            return
+        for event in events:
+            self.inner.record(event)
+
+    def close(self) -> None:
+        """Flush remaining events, then close the inner sink if it supports `close()`."""
+        self.flush()
+        close = getattr(self.inner, "close", None)
+        if close is not None:
+            close()
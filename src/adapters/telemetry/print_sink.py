@@ -3,11 +3,20 @@ from __future__ import annotations
 
 For early development this makes the agent's behavior traceable in stdout.
 In production, use a structured sink (e.g., HTTP, file, or metrics backend).
+
+Events are written as one JSON object per line; pass `pretty=True` for the
+slower, multi-line `pprint` layout.
 """
+import json
+import sys
 from pprint import pprint
+from typing import Iterable
 from src.core.interfaces import TelemetrySink
 from src.core.types import TelemetryEvent
 
+# Fields printed per event, in output order; `timestamp` is deliberately omitted.
+_KEEP = ("interaction_id", "session_id", "stage", "level", "payload")
+
 
 class PrintSink(TelemetrySink):
     """Telemetry sink that prints structured events to stdout.
@@ -15,6 +24,22 @@ class PrintSink(TelemetrySink):
     Useful during development to observe the end-to-end flow without a DB.
     """
 
+    __slots__ = ("pretty",)
+
+    def __init__(self, pretty: bool = False) -> None:
+        """Choose JSON lines (default) or `pprint` output via `pretty`."""
+        self.pretty = pretty
+
     def record(self, event: TelemetryEvent) -> None:
-        """Pretty-print the event (without the raw timestamp)."""
-        pprint({k: v for k, v in event.items() if k != "timestamp"})
+        """Print the event (without the raw timestamp)."""
+        self.record_many((event,))
+
+    def record_many(self, events: Iterable[TelemetryEvent]) -> None:
+        """Print several events with a single stdout write (see `BufferedSink`)."""
+        shown = [{k: getattr(event, k) for k in _KEEP} for event in events]
+        if self.pretty:
+            for item in shown:
+                pprint(item)
+            return
+        # Resolve stdout per call so redirection (pytest capture, Streamlit) still works.
+        sys.stdout.write("".join(json.dumps(item, default=str, ensure_ascii=False) + "\n" for item in shown))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+"""Background-thread telemetry sink.
+
+`record` only enqueues the event; a daemon thread drains the queue and writes
+batches to the wrapped sink. The request path never waits on sink I/O
+(stdout, files, HTTP). Combine with `BufferedSink` so each turn becomes one
+enqueue: `BufferedSink(QueueTelemetrySink(PrintSink()))`.
+
+Call `close()` at shutdown to deliver events still in the queue; the thread is
+a daemon, so anything queued at interpreter exit without `close()` is lost.
+"""
+import queue
+import threading
+from typing import Iterable, List
+from src.core.interfaces import TelemetrySink
+from src.core.types import TelemetryEvent
+
+_STOP = object()
+
+
+class QueueTelemetrySink(TelemetrySink):
+    """Forward events to `inner` from a background thread.
+
+    Events run together in the queue are delivered as one batch
+    (`inner.record_many` when available), in arrival order. Errors raised by
+    `inner` are swallowed so the writer thread keeps running.
+    """
+
+    def __init__(self, inner: TelemetrySink) -> None:
+        """Wrap `inner` and start the writer thread."""
+        self.inner = inner
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def record(self, event: TelemetryEvent) -> None:
+        """Enqueue one event; never blocks on the inner sink."""
+        self._queue.put_nowait(event)
+
+    def record_many(self, events: Iterable[TelemetryEvent]) -> None:
+        """Enqueue several events as a single queue item."""
+        batch = list(events)
+        if batch:
+            self._queue.put_nowait(batch)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver queued events, then stop the writer thread (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put_nowait(_STOP)
+        self._thread.join(timeout)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: List[TelemetryEvent] = []
+            stop = self._extend(batch, item)
+            # Take whatever else is already queued so bursts go out as one write.
+            while not stop:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                stop = self._extend(batch, item)
+            if batch:
+                self._deliver(batch)
+            if stop:
+                return
+
+    @staticmethod
+    def _extend(batch: List[TelemetryEvent], item) -> bool:
+        """Append a queue item to `batch`; True when it is the stop sentinel."""
+        if item is _STOP:
+            return True
+        if isinstance(item, list):
+            batch.extend(item)
+        else:
+            batch.append(item)
+        return False
+
+    def _deliver(self, batch: List[TelemetryEvent]) -> None:
+        # Errors are deliberately swallowed; telemetry must not kill the writer.
+        try:
+            record_many = getattr(self.inner, "record_many", None)
+            if record_many is not None:
+                record_many(batch)
+            else:
+                for event in batch:
+                    self.inner.record(event)
+        except Exception:
+            pass
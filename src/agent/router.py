@@ -5,17 +5,29 @@ Flow summary:
   received → intents_eligible → intent_classified → plan_created → plan_communicated
   → policy_check → tool_execute → respond
 
+Repeated requests (same intent and params) within the response-cache TTL skip
+planning and tool execution; policy is still checked against the cached call:
+  received → intents_eligible → intent_classified → policy_check → cache_hit → respond
+
 This module keeps memory in-process (by session id) and emits structured
 telemetry at each stage via the provided `TelemetrySink`.
 """
-from typing import List
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from src.core.types import (
     Interaction,
     AgentResponse,
     TelemetryEvent,
     ToolCall,
     Plan,
+    PolicyDecision,
     Respond,
+    AskUser,
 )
 from src.core.interfaces import (
     IntentsRegistry,
@@ -28,6 +40,18 @@ from src.core.interfaces import (
 )
 
 
+# Per-turn telemetry callback: `emit(stage, payload)`.
+Emit = Callable[[str, dict], None]
+
+# Order ids in user text (e.g., "O-12345") and the read-only tool prefetched for them.
+_ORDER_ID_RE = re.compile(r"\bO-\d+\b")
+_PREFETCH_TOOL = "check_order_status"
+
+# A started prefetch: the call and its pending result, a thread-pool `Future`
+# in `handle` or an `asyncio.Task` on the caller's loop in `ahandle`.
+Prefetch = Tuple[ToolCall, Union[Future, "asyncio.Task"]]
+
+
 class AgentRouter:
     """Coordinates: intents → classify → plan → policy → tools → respond.
 
@@ -43,11 +67,34 @@ class AgentRouter:
         executor: ToolExecutor,
         telemetry: TelemetrySink,
         memory: ConversationMemory,
+        response_cache_size: int = 256,
+        response_cache_ttl: float | None = 30.0,
+        plan_cache_size: int = 1024,
+        prefetch_orders: bool = True,
     ) -> None:
         """Construct the router with swappable components.
 
         Each dependency implements a `Protocol` so adapters can be swapped
         without changing orchestration logic.
+
+        Successful tool responses are cached by `(intent_id, params)` for
+        `response_cache_ttl` seconds (None = no expiry), keeping at most
+        `response_cache_size` entries; 0 disables the cache. The cache is shared
+        across sessions, so every hit re-runs `policy.validate` on the cached
+        tool call for the current interaction; a denied hit falls back to the
+        normal path.
+
+        Plans are cached by the same key (up to `plan_cache_size`, 0 disables),
+        which assumes the planner is a pure function of intent and params, as
+        `SimplePlanner` is. Call `clear_caches()` after reloading intents.
+
+        With `prefetch_orders`, an order id found in the user text is looked up
+        (via the read-only `check_order_status` tool) while classification
+        runs: on a worker thread in `handle`, as a task on the caller's event
+        loop (through the executor's `aexecute`) in `ahandle`; the result is used only if the plan makes exactly
+        that call and policy allows it. Turns that end without a tool step
+        (unknown intent, cache hit, AskUser) cancel the lookup; a lookup
+        already running on the worker thread finishes and is discarded.
         """
         self.intents = intents
         self.classifier = classifier
@@ -56,263 +103,603 @@ class AgentRouter:
         self.executor = executor
         self.telemetry = telemetry
         self.memory = memory
+        self._resp_cache_size = response_cache_size
+        self._resp_cache_ttl = response_cache_ttl
+        # (intent_id, sorted params) -> (stored_at, response, tool call); oldest → most recently used
+        self._resp_cache: OrderedDict[tuple, Tuple[float, AgentResponse, ToolCall]] = OrderedDict()
+        self._plan_cache_size = plan_cache_size
+        # (intent_id, sorted params) -> indexed plan; insertion-ordered for FIFO eviction
+        self._plan_cache: Dict[tuple, Plan] = {}
+        # Guards both caches: one router may serve several threads (e.g., Streamlit sessions).
+        self._cache_lock = threading.Lock()
+        self._prefetch_orders = prefetch_orders
+        # Sync `handle` only; threads start on first submit, so an idle router costs nothing.
+        self._io = ThreadPoolExecutor(max_workers=2, thread_name_prefix="router-prefetch") if prefetch_orders else None
+
+    def clear_caches(self) -> None:
+        """Drop cached responses and plans (e.g., after intents or tools change)."""
+        with self._cache_lock:
+            self._resp_cache.clear()
+            self._plan_cache.clear()
 
     def handle(self, interaction: Interaction) -> AgentResponse:
         """Process a single user interaction and return a response.
 
         Decomposed into small helpers to keep orchestration readable and testable.
+        Buffered telemetry sinks are flushed once the turn finishes (or fails).
+        The router does not keep a reference to `interaction` after returning, so
+        callers may reuse the same dict for the next turn.
         """
-        session_id, sesh, history = self._init_session(interaction)
-        eligible = self._eligible_intents(interaction, session_id)
-        intent, _ = self._classify_and_merge(interaction, eligible, history, sesh, session_id)
+        prefetch = self._start_prefetch(interaction)
+        try:
+            return self._handle(interaction, prefetch)
+        finally:
+            _cancel_prefetch(prefetch)
+            self._flush_telemetry()
+
+    def _handle(self, interaction: Interaction, prefetch: Optional[Prefetch]) -> AgentResponse:
+        """Body of `handle`; the wrapper drops an unused prefetch and flushes telemetry."""
+        emit, sesh, history = self._init_session(interaction)
+        eligible = self._eligible_intents(interaction, emit)
+        intent, params = self.classifier.classify(interaction, eligible, history)
+        merged = self._merge_classification(interaction, intent, params, sesh, emit)
         if not intent:
-            # Unknown intent: ask LLM to draft a concise clarification with escalation offer.
-            llm = getattr(self.classifier, "llm", None)
-            draft = None
-            if llm is not None:
-                try:
-                    messages = [
-                        {
-                            "role": "system",
-                            "content": (
-                                "You are a helpful support agent. The user request didn’t match a known intent.\n"
-                                "Write a brief, friendly one-sentence clarification that asks what they need, and ALWAYS end with: \"Would you like me to loop in a human support agent?\"\n"
-                                "Do not invent details. Keep it under 25 words."
-                            ),
-                        },
-                        {"role": "user", "content": interaction.get("text", "")},
-                    ]
-                    resp = llm.generate(messages)  # type: ignore[attr-defined]
-                    draft = resp.get("raw") if isinstance(resp, dict) else None
-                except Exception:
-                    draft = None
-            fallback_text = (
-                draft
-                or "I didn’t recognize that yet — could you share a bit more? Would you like me to loop in a human support agent?"
-            )
-            self.telemetry.record(
-                TelemetryEvent(
-                    timestamp="",
-                    interaction_id=interaction.get("id", ""),
-                    session_id=session_id,
-                    stage="respond",
-                    level="info",
-                    payload={"message": fallback_text, "fallback": True, "unknown_intent": True},
-                )
-            )
-            sesh.append({"role": "agent", "text": fallback_text, "metadata": {"type": "fallback", "unknown_intent": True}})
-            return AgentResponse(text=fallback_text)
-        plan = self._create_plan(intent, interaction, sesh, session_id)
+            _cancel_prefetch(prefetch)
+            draft = self._draft_clarification(interaction)
+            return self._respond_unknown(interaction, emit, sesh, draft)
+        return self._run_plan(intent, interaction, sesh, merged, history, emit, prefetch)
+
+    async def ahandle(self, interaction: Interaction) -> AgentResponse:
+        """Async variant of `handle` for serving many interactions concurrently.
+
+        Only the I/O-bound steps are awaited; the remaining stages are cheap and
+        shared with `handle`. When the registry offers `aget_eligible` (e.g., a
+        DB-backed registry), its lookup overlaps with session initialization.
+        A shared buffered sink is flushed as each turn ends, which also delivers
+        events queued so far by other in-flight turns. The tool call is awaited
+        via the executor's `aexecute` when it has one (else run in a thread), so
+        async tool handlers work here.
+        """
+        prefetch = self._astart_prefetch(interaction)
+        try:
+            return await self._ahandle(interaction, prefetch)
+        finally:
+            _cancel_prefetch(prefetch)
+            self._flush_telemetry()
+
+    async def _ahandle(self, interaction: Interaction, prefetch: Optional[Prefetch]) -> AgentResponse:
+        """Body of `ahandle`; the wrapper drops an unused prefetch and flushes telemetry."""
+        aget_eligible = getattr(self.intents, "aget_eligible", None)
+        if aget_eligible is not None:
+            eligible_task = asyncio.create_task(aget_eligible(interaction["context"]))
+            # Yield once so the lookup can issue its I/O before the sync session work below.
+            await asyncio.sleep(0)
+            try:
+                emit, sesh, history = self._init_session(interaction)
+            except BaseException:
+                eligible_task.cancel()
+                raise
+            eligible = await eligible_task
+            self._record_eligible(interaction, emit, eligible)
+        else:
+            emit, sesh, history = self._init_session(interaction)
+            eligible = self._eligible_intents(interaction, emit)
+        aclassify = getattr(self.classifier, "aclassify", None)
+        if aclassify is not None:
+            intent, params = await aclassify(interaction, eligible, history)
+        else:
+            intent, params = await asyncio.to_thread(self.classifier.classify, interaction, eligible, history)
+        merged = self._merge_classification(interaction, intent, params, sesh, emit)
+        if not intent:
+            _cancel_prefetch(prefetch)
+            draft = await self._adraft_clarification(interaction)
+            return self._respond_unknown(interaction, emit, sesh, draft)
+        return await self._arun_plan(intent, interaction, sesh, merged, history, emit, prefetch)
+
+    # --- Helpers ---
+
+    def _emitter(self, interaction_id: str, session_id: str) -> Emit:
+        """Return this turn's `emit(stage, payload)` closure.
+
+        Sinks may supply their own via `emitter(interaction_id, session_id)`,
+        e.g. to write straight to their output without building event dicts.
+        """
+        factory = getattr(self.telemetry, "emitter", None)
+        if factory is not None:
+            return factory(interaction_id, session_id)
+        return _record_emitter(self.telemetry, interaction_id, session_id)
+
+    def _start_prefetch(self, interaction: Interaction) -> Optional[Prefetch]:
+        """Start looking up an order id mentioned in the text on the worker pool.
+
+        None when prefetching is off or the text has no order id.
+        """
+        call = self._prefetch_call(interaction) if self._io is not None else None
+        if call is None:
+            return None
+        return call, self._io.submit(self.executor.execute, call)
+
+    def _astart_prefetch(self, interaction: Interaction) -> Optional[Prefetch]:
+        """Async variant of `_start_prefetch`: a task on the running loop, not a thread."""
+        call = self._prefetch_call(interaction) if self._prefetch_orders else None
+        if call is None:
+            return None
+        aexecute = getattr(self.executor, "aexecute", None)
+        if aexecute is not None:
+            pending = aexecute(call)
+        else:
+            pending = asyncio.to_thread(self.executor.execute, call)
+        return call, asyncio.get_running_loop().create_task(pending)
+
+    @staticmethod
+    def _prefetch_call(interaction: Interaction) -> Optional[ToolCall]:
+        """The order lookup to prefetch for `interaction`, or None without an order id."""
+        m = _ORDER_ID_RE.search(interaction["text"])
+        if m is None:
+            return None
+        return ToolCall(tool_name=_PREFETCH_TOOL, params={"order_id": m.group(0)})
+
+    def _flush_telemetry(self) -> None:
+        """Flush the telemetry sink if it buffers events (e.g., `BufferedSink`)."""
+        flush = getattr(self.telemetry, "flush", None)
+        if flush is not None:
+            flush()
+
+    def _run_plan(
+        self,
+        intent,
+        interaction: Interaction,
+        sesh,
+        params: dict,
+        history: List[dict],
+        emit: Emit,
+        prefetch: Optional[Prefetch] = None,
+    ) -> AgentResponse:
+        """Plan → (ask user | pre respond → policy/tool → post respond) for a known intent.
+
+        `params` is the merged session params snapshot from `_merge_classification`.
+        A cached response for the same intent and params short-circuits the plan
+        once policy allows the cached tool call for this interaction.
+        """
+        early, plan, cache_key, checked = self._prepare_plan(intent, interaction, sesh, params, history, emit)
+        if early is not None:
+            return early
+        self._emit_pre_response(plan, interaction, emit)
+        tool_result, result_text = self._execute_tool_step(plan, interaction, history, emit, prefetch, checked)
+        return self._finish_plan(plan, interaction, sesh, emit, cache_key, tool_result, result_text)
+
+    async def _arun_plan(
+        self,
+        intent,
+        interaction: Interaction,
+        sesh,
+        params: dict,
+        history: List[dict],
+        emit: Emit,
+        prefetch: Optional[Prefetch] = None,
+    ) -> AgentResponse:
+        """Async variant of `_run_plan`; only the tool step is awaited."""
+        early, plan, cache_key, checked = self._prepare_plan(intent, interaction, sesh, params, history, emit)
+        if early is not None:
+            return early
+        self._emit_pre_response(plan, interaction, emit)
+        tool_result, result_text = await self._aexecute_tool_step(plan, interaction, history, emit, prefetch, checked)
+        return self._finish_plan(plan, interaction, sesh, emit, cache_key, tool_result, result_text)
+
+    def _prepare_plan(
+        self, intent, interaction: Interaction, sesh, params: dict, history: List[dict], emit: Emit
+    ) -> Tuple[AgentResponse | None, Plan | None, Optional[tuple], Optional[Tuple[ToolCall, PolicyDecision]]]:
+        """Serve a cache hit or AskUser step, else create the plan.
+
+        Returns `(response, None, None, None)` when the turn is already answered,
+        otherwise `(None, plan, cache_key, checked)`. `checked` is the
+        `(call, decision)` from a cached response that policy denied, so the
+        tool step reuses that decision instead of validating (and reporting)
+        the same call twice.
+        """
+        turn_key = _turn_key(intent, params)
+        cache_key = turn_key if self._resp_cache_size > 0 else None
+        cached = self._cached_response(cache_key)
+        checked = None
+        if cached is not None:
+            response, call = cached
+            decision = self.policy.validate(call, interaction, history)
+            if decision.get("allowed", True):
+                emit("policy_check", {"allowed": True})
+                emit("cache_hit", {"intent_id": intent.get("id")})
+                self._emit_final_response(interaction, emit, sesh, response["text"])
+                return AgentResponse(response), None, None, None
+            # Reported once, by the tool step of the uncached path below.
+            checked = (call, decision)
+        plan = self._create_plan(intent, interaction, params, emit, turn_key)
         # If the plan contains an AskUser step, handle it and return early
-        ask_resp = self._handle_ask_user_step(plan, interaction, session_id, sesh)
+        ask_resp = self._handle_ask_user_step(plan, interaction, emit, sesh)
         if ask_resp:
-            return ask_resp
-        self._emit_pre_response(plan, interaction, session_id)
-        tool_result, result_text = self._execute_tool_step(plan, interaction, history, session_id)
+            return ask_resp, None, None, None
+        return None, plan, cache_key, checked
+
+    def _finish_plan(
+        self, plan: Plan, interaction: Interaction, sesh, emit: Emit, cache_key, tool_result, result_text: str
+    ) -> AgentResponse:
+        """Render the post response, record it, and cache it when the tool succeeded."""
         final_text = self._build_final_text(plan, result_text)
-        self._emit_final_response(interaction, session_id, sesh, final_text)
-        return AgentResponse(text=final_text, tool_result=tool_result)
+        self._emit_final_response(interaction, emit, sesh, final_text)
+        response = AgentResponse(text=final_text, tool_result=tool_result)
+        if cache_key is not None and tool_result is not None and tool_result.ok:
+            self._store_response(cache_key, response, plan["tool"])
+        return response
 
-    # --- Helpers ---
+    def _cached_response(self, key: Optional[tuple]) -> Tuple[AgentResponse, ToolCall] | None:
+        """Return the live `(response, tool_call)` cached for `key`, dropping it if expired."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            entry = self._resp_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, response, call = entry
+            if self._resp_cache_ttl is not None and time.monotonic() - stored_at > self._resp_cache_ttl:
+                del self._resp_cache[key]
+                return None
+            self._resp_cache.move_to_end(key)
+        return response, call
+
+    def _store_response(self, key: tuple, response: AgentResponse, call: ToolCall) -> None:
+        """Cache `response` and the call that produced it, evicting the LRU entry when full."""
+        with self._cache_lock:
+            self._resp_cache[key] = (time.monotonic(), response, call)
+            self._resp_cache.move_to_end(key)
+            while len(self._resp_cache) > self._resp_cache_size:
+                self._resp_cache.popitem(last=False)
+
+    def _clarification_messages(self, interaction: Interaction) -> List[dict]:
+        """Prompt asking the LLM for a short clarification with an escalation offer."""
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are a helpful support agent. The user request didn’t match a known intent.\n"
+                    "Write a brief, friendly one-sentence clarification that asks what they need, and ALWAYS end with: \"Would you like me to loop in a human support agent?\"\n"
+                    "Do not invent details. Keep it under 25 words."
+                ),
+            },
+            {"role": "user", "content": interaction["text"]},
+        ]
+
+    def _draft_clarification(self, interaction: Interaction) -> str | None:
+        """Ask the classifier's LLM (if any) to draft a clarification; None on failure."""
+        llm = getattr(self.classifier, "llm", None)
+        if llm is None:
+            return None
+        try:
+            resp = llm.generate(self._clarification_messages(interaction))  # type: ignore[attr-defined]
+            return resp.get("raw") if isinstance(resp, dict) else None
+        except Exception:
+            return None
+
+    async def _adraft_clarification(self, interaction: Interaction) -> str | None:
+        """Async variant of `_draft_clarification`; prefers the provider's `agenerate`."""
+        llm = getattr(self.classifier, "llm", None)
+        if llm is None:
+            return None
+        agenerate = getattr(llm, "agenerate", None)
+        if agenerate is None:
+            return await asyncio.to_thread(self._draft_clarification, interaction)
+        try:
+            resp = await agenerate(self._clarification_messages(interaction))
+            return resp.get("raw") if isinstance(resp, dict) else None
+        except Exception:
+            return None
+
+    def _respond_unknown(self, interaction: Interaction, emit: Emit, sesh, draft: str | None) -> AgentResponse:
+        """Unknown intent: reply with the drafted (or deterministic) clarification."""
+        fallback_text = (
+            draft
+            or "I didn’t recognize that yet — could you share a bit more? Would you like me to loop in a human support agent?"
+        )
+        payload = {"message": fallback_text, "fallback": True, "unknown_intent": True}
+        emit("respond", payload)
+        sesh.append({"role": "agent", "text": fallback_text, "metadata": {"type": "fallback", "unknown_intent": True}})
+        return AgentResponse(text=fallback_text)
 
     def _init_session(self, interaction: Interaction):
         """Initialize session state and emit a 'received' telemetry event.
 
         - Derives `session_id` from `interaction.context.session_id` or falls back to `interaction.id`.
         - Appends the user message to conversation history.
-        - Returns `(session_id, session_handle, history)`.
+        - Returns `(emit, session_handle, history)`; `emit(stage, payload)` records
+          a telemetry event for this turn (see `_emitter`).
         """
-        session_id = interaction.get("context", {}).get("session_id", interaction.get("id", ""))
+        interaction_id = interaction["id"]
+        session_id = interaction["context"].get("session_id", interaction_id)
         sesh = self.memory.for_session(session_id)
-        sesh.append({"role": "user", "text": interaction.get("text", ""), "metadata": {}})
+        sesh.append({"role": "user", "text": interaction["text"], "metadata": {}})
         history = sesh.history()
-        self.telemetry.record(
-            TelemetryEvent(
-                timestamp="",
-                interaction_id=interaction.get("id", ""),
-                session_id=session_id,
-                stage="received",
-                level="info",
-                payload={
-                    "memory": {
-                        "history_count": len(history),
-                        "params_keys": list(sesh.params().keys()),
-                        "waiting_for_param": sesh.waiting(),
-                    }
-                },
-            )
-        )
-        return session_id, sesh, history
+        history_count, params_keys, waiting = sesh.snapshot()
+        emit = self._emitter(interaction_id, session_id)
+        memory_summary = {
+            "history_count": history_count,
+            "params_keys": list(params_keys),
+            "waiting_for_param": waiting,
+        }
+        emit("received", {"memory": memory_summary})
+        return emit, sesh, history
 
-    def _eligible_intents(self, interaction: Interaction, session_id: str):
+    def _eligible_intents(self, interaction: Interaction, emit: Emit):
         """Compute eligible intents for this interaction and emit telemetry."""
-        eligible = self.intents.get_eligible(interaction.get("context", {}))
-        self.telemetry.record(
-            TelemetryEvent(
-                timestamp="",
-                interaction_id=interaction.get("id", ""),
-                session_id=session_id,
-                stage="intents_eligible",
-                level="info",
-                payload={"eligible": [it.get("id") for it in eligible]},
-            )
-        )
+        eligible = self.intents.get_eligible(interaction["context"])
+        self._record_eligible(interaction, emit, eligible)
         return eligible
 
-    def _classify_and_merge(self, interaction: Interaction, intents: List[dict], history: List[dict], sesh, session_id: str):
-        """Classify intent, merge extracted params into memory, and emit telemetry.
+    def _record_eligible(self, interaction: Interaction, emit: Emit, eligible: List[dict]) -> None:
+        """Emit the 'intents_eligible' telemetry event."""
+        emit("intents_eligible", {"eligible": [it["id"] for it in eligible]})
+
+    def _merge_classification(
+        self, interaction: Interaction, intent, params: dict, sesh, emit: Emit
+    ) -> dict | None:
+        """Merge extracted params into memory and emit 'intent_classified' telemetry.
 
         Also clears `waiting` in memory if the awaited parameter is now present.
-        Returns `(intent, params)` from the classifier.
+        Returns one snapshot of the merged session params for the rest of the
+        turn (None when no intent was chosen, as nothing downstream needs it).
         """
-        intent, params = self.classifier.classify(interaction, intents, history)
         if params:
             sesh.merge(params)
         if sesh.waiting() and params.get(sesh.waiting() or ""):
             sesh.set_waiting(None)
         if intent:
-            self.telemetry.record(
-                TelemetryEvent(
-                    timestamp="",
-                    interaction_id=interaction.get("id", ""),
-                    session_id=session_id,
-                    stage="intent_classified",
-                    level="info",
-                    payload={"intent_id": intent.get("id"), "redacted_params": list(sesh.params().keys())},
-                )
-            )
-        else:
-            self.telemetry.record(
-                TelemetryEvent(
-                    timestamp="",
-                    interaction_id=interaction.get("id", ""),
-                    session_id=session_id,
-                    stage="intent_classified",
-                    level="info",
-                    payload={"intent_id": None, "unknown_intent": True},
-                )
-            )
-        return intent, params
+            merged = sesh.params()
+            payload = {"intent_id": intent.get("id"), "redacted_params": list(merged)}
+            emit("intent_classified", payload)
+            return merged
+        emit("intent_classified", {"intent_id": None, "unknown_intent": True})
+        return None
 
-    def _create_plan(self, intent, interaction, sesh, session_id: str) -> Plan:
-        """Create an execution plan and emit a 'plan_created' telemetry event."""
-        plan: Plan = self.planner.plan(intent, interaction, sesh.params())
-        self.telemetry.record(
-            TelemetryEvent(
-                timestamp="",
-                interaction_id=interaction.get("id", ""),
-                session_id=session_id,
-                stage="plan_created",
-                level="info",
-                payload={"intent_id": intent.get("id"), "steps": [s.get("type", "tool_call") if isinstance(s, dict) and "type" in s else "tool_call" for s in plan["steps"]]},
-            )
-        )
+    def _create_plan(
+        self, intent, interaction, params: dict, emit: Emit, key: Optional[tuple] = None
+    ) -> Plan:
+        """Create (or reuse a cached) execution plan and emit 'plan_created' telemetry.
+
+        Cached plans are shared between turns and must not be mutated.
+        """
+        plan = None
+        if key is not None:
+            with self._cache_lock:
+                plan = self._plan_cache.get(key)
+        if plan is None:
+            plan = self.planner.plan(intent, interaction, params)
+            _index_plan(plan)
+            if key is not None and self._plan_cache_size > 0:
+                with self._cache_lock:
+                    if len(self._plan_cache) >= self._plan_cache_size:
+                        del self._plan_cache[next(iter(self._plan_cache))]
+                    self._plan_cache[key] = plan
+        steps = plan.get("step_kinds")
+        if steps is None:
+            steps = tuple(s.type for s in plan["steps"])
+        payload = {"intent_id": intent.get("id"), "steps": steps}
+        emit("plan_created", payload)
         return plan
 
-    def _handle_ask_user_step(self, plan: Plan, interaction: Interaction, session_id: str, sesh):
+    def _handle_ask_user_step(self, plan: Plan, interaction: Interaction, emit: Emit, sesh):
         """Handle an AskUser step by setting waiting state and returning a prompt.
 
-        If the plan contains an `{type: 'ask_user'}` step, set `memory.waiting(param)`,
+        If the plan contains an `AskUser` step, set `memory.waiting(param)`,
         emit a 'respond' telemetry event with the prompt, append to memory, and
         return `AgentResponse(text=prompt)`. Otherwise return `None`.
         """
-        ask = next((s for s in plan["steps"] if isinstance(s, dict) and s.get("type") == "ask_user"), None)
+        ask = plan.get("ask")
         if not ask:
             return None
-        missing_param = ask.get("param")
-        prompt = ask.get("prompt") or "Could you provide the missing information?"
+        missing_param = ask.param
+        prompt = ask.prompt or "Could you provide the missing information?"
         sesh.set_waiting(missing_param)
-        self.telemetry.record(
-            TelemetryEvent(
-                timestamp="",
-                interaction_id=interaction.get("id", ""),
-                session_id=session_id,
-                stage="respond",
-                level="info",
-                payload={"message": prompt, "waiting_for_param": missing_param},
-            )
-        )
+        emit("respond", {"message": prompt, "waiting_for_param": missing_param})
         sesh.append({"role": "agent", "text": prompt, "metadata": {"type": "ask_user", "param": missing_param}})
         return AgentResponse(text=prompt)
 
-    def _emit_pre_response(self, plan: Plan, interaction: Interaction, session_id: str) -> None:
+    def _emit_pre_response(self, plan: Plan, interaction: Interaction, emit: Emit) -> None:
         """Emit a 'plan_communicated' telemetry event for the pre-respond message, if any."""
-        pre = next((s for s in plan["steps"] if isinstance(s, dict) and s.get("type") == "respond" and s.get("when") == "pre"), None)
-        pre_text = pre.get("message") if pre else None
+        pre = plan.get("pre")
+        pre_text = pre.message if pre else None
         if pre_text:
-            self.telemetry.record(
-                TelemetryEvent(
-                    timestamp="",
-                    interaction_id=interaction.get("id", ""),
-                    session_id=session_id,
-                    stage="plan_communicated",
-                    level="info",
-                    payload={"message": pre_text},
-                )
-            )
+            emit("plan_communicated", {"message": pre_text})
 
-    def _execute_tool_step(self, plan: Plan, interaction: Interaction, history: List[dict], session_id: str):
+    def _execute_tool_step(
+        self,
+        plan: Plan,
+        interaction: Interaction,
+        history: List[dict],
+        emit: Emit,
+        prefetch: Optional[Prefetch] = None,
+        checked: Optional[Tuple[ToolCall, PolicyDecision]] = None,
+    ):
         """Run policy validation and execute the tool step if present.
 
-        Emits telemetry for policy check and tool execution. Returns
+        A matching prefetched result (see `_start_prefetch`) replaces the
+        execution once policy allows the call. Emits telemetry for policy
+        check and tool execution. Returns
         `(tool_result, result_text)` where `result_text` is a human-friendly
         summary suitable for templating into the post response.
         """
-        tool_step = next((s for s in plan["steps"] if not isinstance(s, dict) or "type" not in s), None)
-        result_text = ""
-        tool_result = None
-        if tool_step:
-            call: ToolCall = tool_step  # type: ignore
-            decision = self.policy.validate(call, interaction, history)
-            self.telemetry.record(
-                TelemetryEvent(
-                    timestamp="",
-                    interaction_id=interaction.get("id", ""),
-                    session_id=session_id,
-                    stage="policy_check",
-                    level="info",
-                    payload={"allowed": decision.get("allowed", True)},
-                )
-            )
-            if decision.get("allowed", True):
-                tool_result = self.executor.execute(call)
-                self.telemetry.record(
-                    TelemetryEvent(
-                        timestamp="",
-                        interaction_id=interaction.get("id", ""),
-                        session_id=session_id,
-                        stage="tool_execute",
-                        level="info",
-                        payload={"ok": tool_result.get("ok", False), "tool": call.get("tool_name")},
-                    )
-                )
-                if tool_result.get("ok") and tool_result.get("data"):
-                    data = tool_result.get("data", {})
-                    result_text = _format_order_status_summary(data)
-                else:
-                    result_text = "I couldn’t find that order."
+        call, denied_text = self._authorize_tool_step(plan, interaction, history, emit, checked)
+        if call is None:
+            return None, denied_text
+        tool_result = _take_prefetched(prefetch, call) or self.executor.execute(call)
+        return tool_result, self._summarize_tool_result(call, tool_result, emit)
+
+    async def _aexecute_tool_step(
+        self,
+        plan: Plan,
+        interaction: Interaction,
+        history: List[dict],
+        emit: Emit,
+        prefetch: Optional[Prefetch] = None,
+        checked: Optional[Tuple[ToolCall, PolicyDecision]] = None,
+    ):
+        """Async variant of `_execute_tool_step`; prefers the executor's `aexecute`."""
+        call, denied_text = self._authorize_tool_step(plan, interaction, history, emit, checked)
+        if call is None:
+            return None, denied_text
+        tool_result = await _atake_prefetched(prefetch, call)
+        if tool_result is None:
+            aexecute = getattr(self.executor, "aexecute", None)
+            if aexecute is not None:
+                tool_result = await aexecute(call)
             else:
-                result_text = "This action isn’t allowed by policy."
-        return tool_result, result_text
+                tool_result = await asyncio.to_thread(self.executor.execute, call)
+        return tool_result, self._summarize_tool_result(call, tool_result, emit)
+
+    def _authorize_tool_step(
+        self,
+        plan: Plan,
+        interaction: Interaction,
+        history: List[dict],
+        emit: Emit,
+        checked: Optional[Tuple[ToolCall, PolicyDecision]] = None,
+    ) -> Tuple[ToolCall | None, str]:
+        """Return `(call, "")` when the plan's tool call may run, else `(None, result_text)`.
+
+        A `checked` decision made earlier this turn for the same call is reused.
+        """
+        call = plan.get("tool")
+        if not call:
+            return None, ""
+        if checked is not None and checked[0] == call:
+            decision = checked[1]
+        else:
+            decision = self.policy.validate(call, interaction, history)
+        emit("policy_check", {"allowed": decision.get("allowed", True)})
+        if not decision.get("allowed", True):
+            return None, "This action isn’t allowed by policy."
+        return call, ""
+
+    def _summarize_tool_result(self, call: ToolCall, tool_result, emit: Emit) -> str:
+        """Emit 'tool_execute' telemetry and return the summary text for the post response."""
+        ok, data = tool_result.ok, tool_result.data
+        emit("tool_execute", {"ok": ok, "tool": call.tool_name})
+        if ok and data:
+            return _format_order_status_summary(data)
+        return "I couldn’t find that order."
 
     def _build_final_text(self, plan: Plan, result_text: str) -> str:
         """Apply the post-respond template to the tool summary text."""
-        post = next((s for s in plan["steps"] if isinstance(s, dict) and s.get("type") == "respond" and s.get("when") == "post"), None)
-        return (post.get("message") or "Here’s the result: {summary}").replace("{summary}", result_text) if post else result_text
+        post = plan.get("post")
+        return (post.message or "Here’s the result: {summary}").replace("{summary}", result_text) if post else result_text
 
-    def _emit_final_response(self, interaction: Interaction, session_id: str, sesh, final_text: str) -> None:
+    def _emit_final_response(self, interaction: Interaction, emit: Emit, sesh, final_text: str) -> None:
         """Emit the final 'respond' telemetry and append the agent message to memory."""
-        self.telemetry.record(
+        emit("respond", {"message": final_text})
+        sesh.append({"role": "agent", "text": final_text, "metadata": {}})
+
+
+_PLAN_ROLE_KEYS = ("pre", "tool", "post", "ask")
+
+
+def _index_plan(plan: Plan) -> None:
+    """Fill in missing role fields (`pre`/`tool`/`post`/`ask`) with one pass over the steps.
+
+    Planners that already set all of `_PLAN_ROLE_KEYS` skip the scan. For each
+    role, the first matching step wins.
+    """
+    if all(k in plan for k in _PLAN_ROLE_KEYS):
+        return
+    found: dict = {}
+    for s in plan["steps"]:
+        if isinstance(s, ToolCall):
+            found.setdefault("tool", s)
+        elif isinstance(s, AskUser):
+            found.setdefault("ask", s)
+        elif isinstance(s, Respond) and s.when in ("pre", "post"):
+            found.setdefault(s.when, s)
+    for k in _PLAN_ROLE_KEYS:
+        plan.setdefault(k, found.get(k))  # type: ignore[misc]
+
+
+def _take_prefetched(prefetch: Optional[Prefetch], call: ToolCall):
+    """Return the prefetched result if it was for exactly `call`, else None."""
+    if prefetch is None:
+        return None
+    prefetched_call, future = prefetch
+    if call.tool_name != prefetched_call.tool_name or call.params != prefetched_call.params:
+        _discard(future)
+        return None
+    try:
+        return future.result()
+    except Exception:
+        # Fall back to executing the call directly (and surfacing its error there).
+        return None
+
+
+def _cancel_prefetch(prefetch: Optional[Prefetch]) -> None:
+    """Cancel a prefetch the turn did not use (no-op once it has been consumed)."""
+    if prefetch is not None:
+        _discard(prefetch[1])
+
+
+def _discard(future) -> None:
+    """Cancel a pending `Future`/`Task`, or mark a finished one's error as retrieved."""
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()  # avoids "exception was never retrieved" for an unused task
+
+
+async def _atake_prefetched(prefetch: Optional[Prefetch], call: ToolCall):
+    """Async variant of `_take_prefetched`; awaits the task instead of blocking the loop."""
+    if prefetch is None:
+        return None
+    prefetched_call, task = prefetch
+    if call.tool_name != prefetched_call.tool_name or call.params != prefetched_call.params:
+        _discard(task)
+        return None
+    if task.cancelled():
+        return None
+    try:
+        return await task
+    except Exception:
+        return None
+
+
+def _turn_key(intent, params: dict) -> Optional[tuple]:
+    """Session-agnostic cache key for a turn, or None if a param is unhashable."""
+    key = (intent.get("id"), tuple(sorted(params.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _record_emitter(sink: TelemetrySink, interaction_id: str, session_id: str) -> Emit:
+    """Default emitter: builds each `TelemetryEvent` and passes it to `sink.record`."""
+    record = sink.record
+
+    def emit(stage: str, payload: dict) -> None:
+        record(
             TelemetryEvent(
-                timestamp="",
-                interaction_id=interaction.get("id", ""),
+                interaction_id=interaction_id,
                 session_id=session_id,
-                stage="respond",
-                level="info",
-                payload={"message": final_text},
+                stage=stage,  # type: ignore[arg-type]
+                payload=payload,
             )
         )
-        sesh.append({"role": "agent", "text": final_text, "metadata": {}})
+
+    return emit
+
+
+# Human-readable order statuses; anything else falls back to "_" → " ".
+_STATUS_HUMAN = {
+    "processing": "processing",
+    "shipped": "shipped",
+    "in_transit": "in transit",
+    "out_for_delivery": "out for delivery",
+    "delivered": "delivered",
+    "cancelled": "cancelled",
+    "returned": "returned",
+    "unknown": "unknown",
+}
 
 
 def _format_order_status_summary(order: dict) -> str:
@@ -321,12 +708,10 @@ def _format_order_status_summary(order: dict) -> str:
     This is domain-specific for the demo. Real systems likely render richer
     content or defer formatting to a response template system.
     """
-    status = order.get("status", "unknown").replace("_", " ")
+    raw = order.get("status", "unknown")
+    status = _STATUS_HUMAN.get(raw) or raw.replace("_", " ")
     carrier = order.get("carrier")
     eta = order.get("eta") or order.get("delivered_at")
-    parts = [f"status: {status}"]
-    if carrier:
-        parts.append(f"carrier: {carrier}")
-    if eta:
-        parts.append(f"ETA: {eta}")
-    return ", ".join(parts)
+    c = f", carrier: {carrier}" if carrier else ""
+    e = f", ETA: {eta}" if eta else ""
+    return f"status: {status}{c}{e}"
@@ -4,8 +4,13 @@ from __future__ import annotations
 These `Protocol`s define boundaries so implementations can be swapped without
 changing orchestration logic (e.g., JSON vs. SQL data source, different LLMs,
 local vs. remote executors, etc.).
+
+Each declares `__slots__ = ()` so adapters that subclass them and declare their
+own slots carry no per-instance `__dict__`. The per-turn adapters do (memory
+sessions, executor, planner, policy, registry, print/buffered sinks); adapters
+holding SDK clients or caches keep a regular `__dict__`.
 """
-from typing import Protocol, Any
+from typing import Any, Protocol
 from .types import (
     Interaction,
     ToolCall,
@@ -19,6 +24,8 @@ from .types import (
 
 class DataSource(Protocol):
     """Abstracts access to domain data (orders, customers, tickets)."""
+    __slots__ = ()
+
     def get_order(self, order_id: str) -> dict | None: ...
 
 
@@ -28,6 +35,7 @@ class LLMProvider(Protocol):
     For M1, we primarily use `generate` to support LLM-based classification.
     `route` exists for backward compatibility but is not used here.
     """
+    __slots__ = ()
 
     def generate(self, messages: list[dict], response_format: dict | None = None) -> dict: ...
 
@@ -35,6 +43,8 @@ class LLMProvider(Protocol):
 
 
 class PolicyEngine(Protocol):
+    __slots__ = ()
+
     def validate(
         self, call: ToolCall, interaction: Interaction, history: list[dict]
     ) -> PolicyDecision: ...
@@ -42,22 +52,36 @@ class PolicyEngine(Protocol):
 
 class ToolExecutor(Protocol):
     """Executes registered tool handlers with validated parameters."""
+    __slots__ = ()
+
     def register(self, tool_name: str, handler) -> None: ...
     def execute(self, call: ToolCall) -> ToolResult: ...
 
 
 class TelemetrySink(Protocol):
     """Records structured events for observability and evaluation."""
+    __slots__ = ()
+
     def record(self, event: TelemetryEvent) -> None: ...
 
 
 class IntentsRegistry(Protocol):
-    """Provides the set of intents eligible for the current context."""
+    """Provides the set of intents eligible for the current context.
+
+    I/O-backed registries may also define `async aget_eligible(context)`;
+    `AgentRouter.ahandle` overlaps it with session initialization. Returned
+    lists may be shared between calls; treat them as read-only. Every intent
+    carries an `id`.
+    """
+    __slots__ = ()
+
     def get_eligible(self, context: dict) -> list[Intent]: ...
 
 
 class IntentClassifier(Protocol):
     """Maps a user interaction to an eligible intent and extracts intent parameters."""
+    __slots__ = ()
+
     def classify(
         self, interaction: Interaction, intents: list[Intent], history: list[dict]
     ) -> tuple[Intent | None, dict]: ...
@@ -65,6 +89,8 @@ class IntentClassifier(Protocol):
 
 class Planner(Protocol):
     """Converts a chosen intent + parameters into an executable plan (steps)."""
+    __slots__ = ()
+
     def plan(self, intent: Intent, interaction: Interaction, params: dict) -> Plan: ...
 
 
@@ -73,7 +99,10 @@ class SessionMemoryHandle(Protocol):
 
     Keeps history, parameters, and the waiting-for-param flag together so Router
     code remains readable. Implementations can back this with dicts or a DB.
+
+    `history()`/`params()` return copies the caller may mutate.
     """
+    __slots__ = ()
 
     def history(self) -> list[dict]: ...
     def append(self, message: dict) -> None: ...
@@ -84,11 +113,16 @@ class SessionMemoryHandle(Protocol):
     def waiting(self) -> str | None: ...
     def set_waiting(self, name: str | None) -> None: ...
 
+    def snapshot(self) -> tuple[int, tuple[str, ...], str | None]:
+        """Return `(history_len, param_names, waiting)` in one call (for telemetry)."""
+        ...
+
     def prune(self, max_messages: int = 10) -> None: ...
     def clear(self) -> None: ...
 
 
 class ConversationMemory(Protocol):
     """Factory for per-session memory handles."""
+    __slots__ = ()
 
     def for_session(self, session_id: str) -> SessionMemoryHandle: ...
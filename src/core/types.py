@@ -3,32 +3,40 @@ from __future__ import annotations
 
 The project favors simple, explicit `TypedDict` structures for message passing
 between components. This keeps adapters loosely coupled and easy to test.
+
+Records created on every turn (plan steps `ToolCall`/`AskUser`/`Respond`,
+`ToolResult`, and `TelemetryEvent`) are slotted, frozen dataclasses instead:
+they are allocated on the hot path, and slots make them smaller and faster to
+read than a dict. Plan steps carry their kind in a class-level `type` attribute.
 """
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TypedDict, Literal, Union
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, NotRequired, Optional, Sequence, Tuple, TypedDict, Literal, Union
 
 
-class Interaction(TypedDict, total=False):
+class Interaction(TypedDict):
     id: str
     text: str
-    customer_id: Optional[str]
+    customer_id: NotRequired[Optional[str]]
     context: Dict[str, Any]
 
 
-class ToolCall(TypedDict):
+@dataclass(slots=True, frozen=True)
+class ToolCall:
+    type: ClassVar[Literal["tool_call"]] = "tool_call"
     tool_name: Literal["check_order_status"]
-    params: Dict[str, Any]
+    params: Dict[str, Any] = field(default_factory=dict)
 
 
 class PolicyDecision(TypedDict):
     allowed: bool
-    reasons: List[str]
+    reasons: Sequence[str]
 
 
-class ToolResult(TypedDict, total=False):
+@dataclass(slots=True, frozen=True)
+class ToolResult:
     ok: bool
-    data: Optional[Dict[str, Any]]
-    error: Optional[str]
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
 
 
 class AgentResponse(TypedDict, total=False):
@@ -46,14 +54,16 @@ class Intent(TypedDict, total=False):
     redaction: Dict[str, Any]
 
 
-class AskUser(TypedDict):
-    type: Literal["ask_user"]
+@dataclass(slots=True, frozen=True)
+class AskUser:
+    type: ClassVar[Literal["ask_user"]] = "ask_user"
     param: str
     prompt: str
 
 
-class Respond(TypedDict):
-    type: Literal["respond"]
+@dataclass(slots=True, frozen=True)
+class Respond:
+    type: ClassVar[Literal["respond"]] = "respond"
     when: Literal["pre", "post", "error"]
     message: str
 
@@ -64,12 +74,21 @@ PlanStep = Union[ToolCall, AskUser, Respond]
 class Plan(TypedDict):
     intent_id: str
     steps: List[PlanStep]
-
-
-class TelemetryEvent(TypedDict, total=False):
-    timestamp: str
-    interaction_id: str
-    session_id: str
+    # Well-known steps by role (None = absent); `steps` keeps the order. Lets the
+    # router read them directly instead of scanning. Filled in when omitted.
+    pre: NotRequired[Optional[Respond]]
+    tool: NotRequired[Optional[ToolCall]]
+    post: NotRequired[Optional[Respond]]
+    ask: NotRequired[Optional[AskUser]]
+    # `type` of each step in order, for telemetry; derived by the router when omitted.
+    step_kinds: NotRequired[Tuple[str, ...]]
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TelemetryEvent:
+    timestamp: str = ""
+    interaction_id: str = ""
+    session_id: str = ""
     stage: Literal[
         "received",
         "intents_eligible",
@@ -78,10 +97,11 @@ class TelemetryEvent(TypedDict, total=False):
         "plan_communicated",
         "policy_check",
         "tool_execute",
+        "cache_hit",
         "respond",
     ]
-    level: Literal["info", "warn", "error"]
-    payload: Dict[str, Any]
+    level: Literal["info", "warn", "error"] = "info"
+    payload: Dict[str, Any] = field(default_factory=dict)
 
 
 StepStatus = Literal[
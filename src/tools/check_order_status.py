@@ -9,16 +9,20 @@ from typing import Callable
 from src.core.types import ToolResult
 from src.core.interfaces import DataSource
 
+# Error results are frozen, so one shared instance per error is safe to return.
+_MISSING_ORDER_ID = ToolResult(ok=False, error="missing order_id")
+_ORDER_NOT_FOUND = ToolResult(ok=False, error="order_not_found")
+
 
 def make_check_order_status(ds: DataSource) -> Callable[[dict], ToolResult]:
     """Factory returning a handler bound to the provided data source."""
     def _handler(params: dict) -> ToolResult:
         order_id = params.get("order_id")
         if not order_id:
-            return ToolResult(ok=False, error="missing order_id")
+            return _MISSING_ORDER_ID
         order = ds.get_order(order_id)
         if not order:
-            return ToolResult(ok=False, error="order_not_found")
+            return _ORDER_NOT_FOUND
         return ToolResult(ok=True, data=order)
 
     return _handler
@@ -20,31 +20,32 @@ import sys
 import pathlib
 import streamlit as st
 
-# Load environment variables from .env if present
-try:
-    from dotenv import load_dotenv  # type: ignore
-
-    load_dotenv()
-except Exception:
-    pass
-
 # Ensure project root is on sys.path when running via `streamlit run src/ui/chat.py`
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.core.types import Interaction
-from src.agent.router import AgentRouter
-from src.adapters.datasource.json_data_source import JSONDataSource
-from src.adapters.policy.null_policy import NullPolicyEngine
-from src.adapters.telemetry.print_sink import PrintSink
-from src.adapters.executor.local_executor import LocalExecutor
-from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
-from src.adapters.llm.openai_provider import OpenAIProvider
-from src.adapters.classifier.llm_intent_classifier import LLMIntentClassifier
-from src.adapters.planner.simple_planner import SimplePlanner
-from src.adapters.memory.in_memory import InMemoryConversationMemory
-from src.tools.check_order_status import make_check_order_status
+
+# UI strings and defaults. `OPENAI_MODEL` itself is read in `get_router_and_memory`,
+# after `.env` has been loaded.
+DEFAULT_MODEL = "gpt-4o-mini"
+APP_TITLE = "CX Agent Chat"
+PAGE_ICON = "🤖"
+APP_CAPTION = "Test multi-turn memory, parameter collection, and tool execution."
+_SIDEBAR_CAPTION = "Multi-turn memory demo"
+_SIDEBAR_MISSING_KEY = "OPENAI_API_KEY not set. Set it and rerun."
+
+
+@st.cache_resource(show_spinner=False)
+def load_env() -> None:
+    """Load environment variables from .env if present (once per process)."""
+    try:
+        from dotenv import load_dotenv  # type: ignore
+
+        load_dotenv()
+    except Exception:
+        pass
 
 
 @st.cache_resource(show_spinner=False)
@@ -52,20 +53,35 @@ def get_router_and_memory():
     """Construct and cache the AgentRouter and its memory instance.
 
     The memory object is returned so the UI can render message history directly
-    from the authoritative store used by the router.
+    from the authoritative store used by the router. Adapter imports live here
+    so they run once per process instead of at module load on every rerun.
     """
+    from src.agent.router import AgentRouter
+    from src.adapters.datasource.json_data_source import JSONDataSource
+    from src.adapters.policy.null_policy import NullPolicyEngine
+    from src.adapters.telemetry.print_sink import PrintSink
+    from src.adapters.telemetry.buffered_sink import BufferedSink
+    from src.adapters.executor.local_executor import LocalExecutor
+    from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
+    from src.adapters.llm.openai_provider import OpenAIProvider
+    from src.adapters.classifier.llm_intent_classifier import LLMIntentClassifier
+    from src.adapters.planner.simple_planner import SimplePlanner
+    from src.adapters.memory.in_memory import InMemoryConversationMemory
+    from src.tools.check_order_status import make_check_order_status
+
     # Data and tools
     ds = JSONDataSource("data/orders.json")
     executor = LocalExecutor()
     executor.register("check_order_status", make_check_order_status(ds))
+    executor.freeze()
 
     # Policies and telemetry
     policy = NullPolicyEngine()
-    telemetry = PrintSink()
+    telemetry = BufferedSink(PrintSink())
 
     # Intents + classifier (LLM-based via OpenAI)
     intents = YAMLIntentsRegistry("config/intents.yaml")
-    llm = OpenAIProvider(model=os.getenv("OPENAI_MODEL") or "gpt-4o-mini")
+    llm = OpenAIProvider(model=os.getenv("OPENAI_MODEL") or DEFAULT_MODEL)
     classifier = LLMIntentClassifier(llm)
     planner = SimplePlanner()
     memory = InMemoryConversationMemory(max_messages=20)
@@ -91,11 +107,11 @@ def ensure_session_id() -> str:
 
 def render_sidebar(sid: str, ready: bool) -> None:
     """Sidebar with controls and quick info."""
-    st.sidebar.header("CX Agent Chat")
-    st.sidebar.caption("Multi-turn memory demo")
+    st.sidebar.header(APP_TITLE)
+    st.sidebar.caption(_SIDEBAR_CAPTION)
     st.sidebar.write(f"Session: `{sid}`")
     if not ready:
-        st.sidebar.error("OPENAI_API_KEY not set. Set it and rerun.")
+        st.sidebar.error(_SIDEBAR_MISSING_KEY)
     if st.sidebar.button("Reset Conversation", use_container_width=True):
         # Clear memory for this session and the chat transcript
         try:
@@ -108,10 +124,12 @@ def render_sidebar(sid: str, ready: bool) -> None:
 
 
 def main() -> None:
-    st.set_page_config(page_title="CX Agent Chat", page_icon="🤖", layout="centered")
-    st.title("CX Agent Chat")
-    st.caption("Test multi-turn memory, parameter collection, and tool execution.")
+    st.set_page_config(page_title=APP_TITLE, page_icon=PAGE_ICON, layout="centered")
+    st.title(APP_TITLE)
+    st.caption(APP_CAPTION)
 
+    # Must run before any environment reads below.
+    load_env()
     sid = ensure_session_id()
     ready = bool(os.getenv("OPENAI_API_KEY"))
     render_sidebar(sid, ready)
@@ -159,12 +177,13 @@ def main() -> None:
             with st.chat_message("agent"):
                 st.warning("Agent is not initialized. Check the error above (likely OpenAI SDK or API key). Run `pip install -r requirements.txt` and set `OPENAI_API_KEY`.")
         else:
-            # Build interaction and call router
-            interaction: Interaction = {
-                "id": f"msg-{int(time.time()*1000)}",
-                "text": prompt,
-                "context": {"session_id": sid, "channel": "chat"},
-            }
+            # Reuse one interaction dict per session; the router does not keep it across turns.
+            interaction: Interaction = st.session_state.get("_interaction_buf")
+            if interaction is None:
+                interaction = {"id": "", "text": "", "context": {"session_id": sid, "channel": "chat"}}
+                st.session_state["_interaction_buf"] = interaction
+            interaction["id"] = f"msg-{int(time.time()*1000)}"
+            interaction["text"] = prompt
             response = router.handle(interaction)
 
             # Display agent response
@@ -0,0 +1,101 @@
+from __future__ import annotations
+"""Shared test doubles for router and adapter tests.
+
+Builds a router over the real registry, planner, memory and order data, with a
+deterministic regex classifier in place of the LLM.
+"""
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.agent.router import AgentRouter
+from src.adapters.datasource.json_data_source import JSONDataSource
+from src.adapters.executor.local_executor import LocalExecutor
+from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
+from src.adapters.memory.in_memory import InMemoryConversationMemory
+from src.adapters.planner.simple_planner import SimplePlanner
+from src.adapters.policy.null_policy import NullPolicyEngine
+from src.core.types import Intent, Interaction, PolicyDecision, ToolCall
+from src.tools.check_order_status import make_check_order_status
+
+ROOT = Path(__file__).resolve().parents[1]
+_ORDER_RE = re.compile(r"\bO-\d+\b")
+
+
+class RegexClassifier:
+    """Picks the first eligible intent when the text mentions an order."""
+
+    def classify(
+        self, interaction: Interaction, intents: List[Intent], history: List[dict]
+    ) -> Tuple[Intent | None, Dict]:
+        """Return `(order_status, {order_id?})` for order messages, else `(None, {})`."""
+        text = interaction["text"]
+        m = _ORDER_RE.search(text)
+        if not intents or not (m or "order" in text.lower()):
+            return None, {}
+        return intents[0], ({"order_id": m.group(0)} if m else {})
+
+
+class ListSink:
+    """Telemetry sink that keeps every event in memory."""
+
+    def __init__(self) -> None:
+        self.events: list = []
+
+    def record(self, event) -> None:
+        """Append the event."""
+        self.events.append(event)
+
+    def stages(self) -> List[str]:
+        """Stage names recorded so far, in order."""
+        return [e.stage for e in self.events]
+
+
+class OwnerOnlyPolicy:
+    """Allows tool calls only for the `owner` session."""
+
+    def validate(self, call: ToolCall, interaction: Interaction, history: list[dict]) -> PolicyDecision:
+        """Allow when `context.session_id` is `owner`."""
+        allowed = interaction["context"].get("session_id") == "owner"
+        return PolicyDecision(allowed=allowed, reasons=() if allowed else ("not_owner",))
+
+
+class CountingTool:
+    """Wraps `check_order_status` and counts invocations."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.order_ids: List[str] = []
+        self._inner = make_check_order_status(JSONDataSource(ROOT / "data" / "orders.json", preload=False))
+
+    def __call__(self, params: dict):
+        """Look up the order and count the call."""
+        self.calls += 1
+        self.order_ids.append(params.get("order_id"))
+        return self._inner(params)
+
+
+def build_router(policy=None, tool=None, **kwargs):
+    """Return `(router, sink, tool)` wired with test doubles; kwargs go to `AgentRouter`."""
+    tool = tool or CountingTool()
+    executor = LocalExecutor()
+    executor.register("check_order_status", tool)
+    executor.freeze()
+    sink = ListSink()
+    kwargs.setdefault("prefetch_orders", False)
+    router = AgentRouter(
+        intents=YAMLIntentsRegistry(ROOT / "config" / "intents.yaml"),
+        classifier=RegexClassifier(),
+        planner=SimplePlanner(),
+        policy=policy or NullPolicyEngine(),
+        executor=executor,
+        telemetry=sink,
+        memory=InMemoryConversationMemory(max_messages=10),
+        **kwargs,
+    )
+    return router, sink, tool
+
+
+def interaction(text: str, session_id: str = "s-1", iid: str = "i-1") -> Interaction:
+    """Build a chat interaction for `session_id`."""
+    return {"id": iid, "text": text, "context": {"session_id": session_id, "channel": "chat"}}
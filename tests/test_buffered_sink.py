@@ -0,0 +1,62 @@
+from __future__ import annotations
+"""`BufferedSink`: explicit, size-triggered and shutdown flushes."""
+from src.adapters.telemetry.buffered_sink import BufferedSink
+from src.core.types import TelemetryEvent
+from tests.fakes import ListSink, build_router, interaction
+
+
+class _BatchSink(ListSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list = []
+        self.closed = False
+
+    def record_many(self, events) -> None:
+        self.batches.append(list(events))
+        self.events.extend(self.batches[-1])
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _event(n: int) -> TelemetryEvent:
+    return TelemetryEvent(interaction_id=f"i-{n}", stage="received")
+
+
+def test_events_wait_for_flush_and_go_out_as_one_batch():
+    inner = _BatchSink()
+    sink = BufferedSink(inner)
+    for n in range(3):
+        sink.record(_event(n))
+    assert inner.events == []
+    sink.flush()
+    assert [[e.interaction_id for e in b] for b in inner.batches] == [["i-0", "i-1", "i-2"]]
+    sink.flush()  # nothing pending: no empty batch
+    assert len(inner.batches) == 1
+
+
+def test_flushes_when_max_pending_is_reached():
+    inner = _BatchSink()
+    sink = BufferedSink(inner, max_pending=2)
+    for n in range(5):
+        sink.record(_event(n))
+    assert [len(b) for b in inner.batches] == [2, 2]
+    sink.close()
+    assert [e.interaction_id for e in inner.events] == [f"i-{n}" for n in range(5)]
+
+
+def test_close_flushes_and_closes_inner():
+    inner = _BatchSink()
+    sink = BufferedSink(inner)
+    sink.record(_event(0))
+    sink.close()
+    assert len(inner.events) == 1 and inner.closed
+
+
+def test_router_flushes_once_per_turn():
+    inner = _BatchSink()
+    router, _, _ = build_router()
+    router.telemetry = BufferedSink(inner)
+    router.handle(interaction("Where is my order O-12345?"))
+    assert len(inner.batches) == 1
+    assert inner.batches[0][0].stage == "received" and inner.batches[0][-1].stage == "respond"
@@ -0,0 +1,83 @@
+from __future__ import annotations
+"""`CascadedClassifier`: when the fast result is accepted and when `slow` runs."""
+import asyncio
+
+from src.adapters.classifier.cascaded_classifier import CascadedClassifier
+from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
+from tests.fakes import ROOT, RegexClassifier, interaction
+
+
+class _Slow:
+    """Slow classifier that records calls and always answers `order_status`."""
+
+    def __init__(self, intents) -> None:
+        self.intents = intents
+        self.calls: list = []
+
+    def classify(self, interaction, intents, history):
+        self.calls.append(("classify", interaction["text"]))
+        return intents[0], {"order_id": "O-SLOW"}
+
+
+class _AsyncSlow(_Slow):
+    async def aclassify(self, interaction, intents, history):
+        self.calls.append(("aclassify", interaction["text"]))
+        return intents[0], {"order_id": "O-SLOW"}
+
+
+def _intents():
+    return YAMLIntentsRegistry(ROOT / "config" / "intents.yaml").get_eligible({"channel": "chat"})
+
+
+def test_conclusive_fast_result_skips_slow():
+    intents = _intents()
+    slow = _Slow(intents)
+    cascade = CascadedClassifier(RegexClassifier(), slow)
+    intent, params = cascade.classify(interaction("where is O-12345"), intents, [])
+    assert intent["id"] == "order_status" and params == {"order_id": "O-12345"}
+    assert slow.calls == []
+
+
+def test_missing_required_param_falls_back_to_slow():
+    intents = _intents()
+    slow = _Slow(intents)
+    cascade = CascadedClassifier(RegexClassifier(), slow)
+    _, params = cascade.classify(interaction("where is my order"), intents, [])
+    assert params == {"order_id": "O-SLOW"}
+    assert slow.calls == [("classify", "where is my order")]
+
+
+def test_no_fast_intent_falls_back_to_slow():
+    intents = _intents()
+    slow = _Slow(intents)
+    cascade = CascadedClassifier(RegexClassifier(), slow)
+    cascade.classify(interaction("hello"), intents, [])
+    assert slow.calls == [("classify", "hello")]
+
+
+def test_aclassify_awaits_slow_aclassify_only_on_fallback():
+    intents = _intents()
+    slow = _AsyncSlow(intents)
+    cascade = CascadedClassifier(RegexClassifier(), slow)
+    fast = asyncio.run(cascade.aclassify(interaction("where is O-12345"), intents, []))
+    assert fast[1] == {"order_id": "O-12345"} and slow.calls == []
+    asyncio.run(cascade.aclassify(interaction("hello"), intents, []))
+    assert slow.calls == [("aclassify", "hello")]
+
+
+def test_aclassify_runs_sync_slow_off_the_event_loop():
+    intents = _intents()
+    on_loop = []
+
+    class _ThreadCheckingSlow(_Slow):
+        def classify(self, interaction, intents, history):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return super().classify(interaction, intents, history)
+
+    cascade = CascadedClassifier(RegexClassifier(), _ThreadCheckingSlow(intents))
+    asyncio.run(cascade.aclassify(interaction("hello"), intents, []))
+    assert on_loop == [False]
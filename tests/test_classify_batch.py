@@ -0,0 +1,88 @@
+from __future__ import annotations
+"""`LLMIntentClassifier.classify_batch` chunking and reply parsing."""
+from src.adapters.classifier.llm_intent_classifier import LLMIntentClassifier
+from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
+from tests.fakes import ROOT, interaction
+
+
+class _ScriptedLLM:
+    """Returns the queued replies in order and records each prompt."""
+
+    def __init__(self, *replies) -> None:
+        self.replies = list(replies)
+        self.prompts: list = []
+
+    def generate(self, messages, response_format=None):
+        self.prompts.append(messages)
+        return self.replies.pop(0)
+
+
+def _intents():
+    return YAMLIntentsRegistry(ROOT / "config" / "intents.yaml").get_eligible({"channel": "chat"})
+
+
+def _order(order_id: str) -> dict:
+    return {"intent_id": "order_status", "params": {"order_id": order_id}}
+
+
+def _batch(n: int):
+    return [interaction(f"message {i}", iid=f"i-{i}") for i in range(n)]
+
+
+def test_one_call_per_chunk_in_input_order():
+    llm = _ScriptedLLM(
+        {"classifications": [_order("O-1"), _order("O-2")]},
+        {"classifications": [_order("O-3")]},
+    )
+    results = LLMIntentClassifier(llm).classify_batch(_batch(3), _intents(), batch_size=2)
+    assert len(llm.prompts) == 2
+    assert [params for _, params in results] == [{"order_id": f"O-{i}"} for i in (1, 2, 3)]
+    assert all(intent["id"] == "order_status" for intent, _ in results)
+    assert "1. message 0\n2. message 1" in llm.prompts[0][1]["content"]
+
+
+def test_short_reply_pads_missing_items_with_no_intent():
+    llm = _ScriptedLLM({"classifications": [_order("O-1")]})
+    results = LLMIntentClassifier(llm).classify_batch(_batch(3), _intents())
+    assert results[0][1] == {"order_id": "O-1"}
+    assert results[1:] == [(None, {}), (None, {})]
+
+
+def test_extra_items_are_ignored():
+    llm = _ScriptedLLM({"classifications": [_order("O-1"), _order("O-2"), _order("O-3")]})
+    results = LLMIntentClassifier(llm).classify_batch(_batch(1), _intents())
+    assert len(results) == 1 and results[0][1] == {"order_id": "O-1"}
+
+
+def test_malformed_items_resolve_to_no_intent():
+    llm = _ScriptedLLM(
+        {
+            "classifications": [
+                "order_status",  # not an object
+                {"params": {"order_id": "O-1"}},  # no intent_id
+                {"intent_id": "order_status", "params": ["O-1"]},  # ill-typed params
+                {"intent_id": "refund", "params": {}},  # not an eligible intent
+                _order("O-5"),
+            ]
+        }
+    )
+    results = LLMIntentClassifier(llm).classify_batch(_batch(5), _intents())
+    assert results[:4] == [(None, {})] * 4
+    assert results[4][1] == {"order_id": "O-5"}
+
+
+def test_malformed_reply_fails_only_its_chunk():
+    llm = _ScriptedLLM(
+        {"raw": "not json"},
+        {"classifications": {"0": _order("O-1")}},  # not a list
+        {"classifications": [_order("O-3")]},
+    )
+    results = LLMIntentClassifier(llm).classify_batch(_batch(3), _intents(), batch_size=1)
+    assert results[:2] == [(None, {}), (None, {})]
+    assert results[2][1] == {"order_id": "O-3"}
+
+
+def test_empty_input_makes_no_calls():
+    llm = _ScriptedLLM()
+    assert LLMIntentClassifier(llm).classify_batch([], _intents()) == []
+    assert llm.prompts == []
@@ -0,0 +1,26 @@
+from __future__ import annotations
+"""`InMemoryConversationMemory` eviction and recycling."""
+from src.adapters.memory.in_memory import InMemoryConversationMemory
+
+
+def test_evicted_handle_is_not_reused_by_the_next_session():
+    memory = InMemoryConversationMemory(max_sessions=1)
+    alice = memory.for_session("alice")
+    carol = memory.for_session("carol")
+    alice.append({"role": "user", "text": "late write"})
+    assert alice is not carol
+    assert carol.history() == []
+
+
+def test_evicted_session_starts_empty_when_it_returns():
+    memory = InMemoryConversationMemory(max_sessions=1)
+    memory.for_session("alice").merge({"order_id": "O-1"})
+    memory.for_session("carol")
+    assert memory.for_session("alice").params() == {}
+
+
+def test_discarded_session_is_cleared_before_reuse():
+    memory = InMemoryConversationMemory()
+    memory.for_session("alice").append({"role": "user", "text": "hi"})
+    memory.discard("alice")
+    assert memory.for_session("bob").history() == []
@@ -0,0 +1,43 @@
+from __future__ import annotations
+"""`LLMCache` eviction and expiry, and `make_cache_key` stability."""
+import src.adapters.llm.cache as cache_mod
+from src.adapters.llm.cache import LLMCache, make_cache_key
+
+_MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LLMCache(max_entries=2)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}  # "b" is now the LRU entry
+    cache.set("c", {"v": 3})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1} and cache.get("c") == {"v": 3}
+    assert len(cache) == 2
+
+
+def test_entry_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    cache = LLMCache(ttl_seconds=10.0)
+    cache.set("a", {"v": 1})
+    now[0] += 10.0
+    assert cache.get("a") == {"v": 1}
+    now[0] += 0.5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_key_ignores_dict_order_but_not_content():
+    base = make_cache_key("m", [{"role": "user", "content": "hi"}], {"type": "json_object"}, 0)
+    reordered = make_cache_key("m", [{"content": "hi", "role": "user"}], {"type": "json_object"}, 0)
+    assert base == reordered
+    assert base != make_cache_key("m", [{"role": "user", "content": "hey"}], {"type": "json_object"}, 0)
+    assert base != make_cache_key("other", _MESSAGES, {"type": "json_object"}, 0)
+    assert base != make_cache_key("m", _MESSAGES, None, 0)
+
+
+def test_key_includes_temperature():
+    assert make_cache_key("m", _MESSAGES, None, 0) != make_cache_key("m", _MESSAGES, None, 0.7)
+    assert make_cache_key("m", _MESSAGES, None, 0) != make_cache_key("m", _MESSAGES, None)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+"""`LocalExecutor` with async tool handlers, and the router's async tool path."""
+import asyncio
+
+import pytest
+
+from src.adapters.executor.local_executor import LocalExecutor
+from src.core.types import ToolCall, ToolResult
+from tests.fakes import build_router, interaction
+
+
+async def _async_lookup(params: dict) -> ToolResult:
+    await asyncio.sleep(0)
+    return ToolResult(ok=True, data={"order_id": params["order_id"], "status": "shipped"})
+
+
+def _executor() -> LocalExecutor:
+    executor = LocalExecutor()
+    executor.register("check_order_status", _async_lookup)
+    return executor
+
+
+def test_execute_drives_async_handler_without_a_running_loop():
+    result = _executor().execute(ToolCall(tool_name="check_order_status", params={"order_id": "O-1"}))
+    assert result.ok and result.data["order_id"] == "O-1"
+
+
+def test_execute_inside_running_loop_raises_clear_error():
+    async def run():
+        _executor().execute(ToolCall(tool_name="check_order_status", params={"order_id": "O-1"}))
+
+    with pytest.raises(RuntimeError, match="aexecute"):
+        asyncio.run(run())
+
+
+def test_aexecute_awaits_async_handler():
+    result = asyncio.run(_executor().aexecute(ToolCall(tool_name="check_order_status", params={"order_id": "O-1"})))
+    assert result.ok
+
+
+def test_ahandle_uses_async_tool_handler():
+    router, _, _ = build_router(tool=_async_lookup)
+    response = asyncio.run(router.ahandle(interaction("Where is my order O-12345?")))
+    assert response["tool_result"].ok
+    assert "shipped" in response["text"]
+
+
+class _AsyncCallable:
+    """Handler object whose `__call__` is a coroutine function."""
+
+    async def __call__(self, params: dict) -> ToolResult:
+        await asyncio.sleep(0)
+        return ToolResult(ok=True, data={"order_id": params["order_id"]})
+
+
+def test_aexecute_awaits_async_callable_object():
+    executor = LocalExecutor()
+    executor.register("check_order_status", _AsyncCallable())
+    result = asyncio.run(executor.aexecute(ToolCall(tool_name="check_order_status", params={"order_id": "O-1"})))
+    assert isinstance(result, ToolResult) and result.data == {"order_id": "O-1"}
+
+
+def test_execute_many_keeps_call_order_and_isolates_failures():
+    def boom(params: dict):
+        raise ValueError("down")
+
+    executor = _executor()
+    executor.register("boom", boom)
+    calls = [
+        ToolCall(tool_name="check_order_status", params={"order_id": "O-1"}),
+        ToolCall(tool_name="boom", params={}),
+        ToolCall(tool_name="missing", params={}),  # type: ignore[arg-type]
+        ToolCall(tool_name="check_order_status", params={"order_id": "O-2"}),
+    ]
+    results = asyncio.run(executor.execute_many(calls))
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert results[0].data["order_id"] == "O-1" and results[3].data["order_id"] == "O-2"
+    assert "ValueError" in results[1].error
+    assert results[2].error == "unknown_tool"
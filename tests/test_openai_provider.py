@@ -0,0 +1,84 @@
+from __future__ import annotations
+"""`OpenAIProvider` async client lifecycle, with the SDK replaced by fakes."""
+import asyncio
+
+import pytest
+
+import src.adapters.llm.openai_provider as provider_mod
+
+
+class _Completions:
+    def __init__(self, owner: "_FakeAsyncOpenAI") -> None:
+        self._owner = owner
+
+    async def create(self, **kwargs):
+        assert asyncio.get_running_loop() is self._owner.loop, "client used on a foreign loop"
+        message = type("M", (), {"content": '{"ok": true}'})()
+        return type("Comp", (), {"choices": [type("C", (), {"message": message})()]})()
+
+
+class _FakeAsyncOpenAI:
+    instances: list = []
+
+    def __init__(self, http_client=None) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.chat = type("Chat", (), {})()
+        self.chat.completions = _Completions(self)
+        _FakeAsyncOpenAI.instances.append(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(provider_mod, "OpenAI", lambda: object())
+    monkeypatch.setattr(provider_mod, "AsyncOpenAI", _FakeAsyncOpenAI)
+    monkeypatch.setattr(provider_mod, "httpx", None)
+    _FakeAsyncOpenAI.instances = []
+    return provider_mod.OpenAIProvider(model="test-model")
+
+
+_MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def test_each_event_loop_gets_its_own_client(provider):
+    for _ in range(3):
+        assert asyncio.run(provider.agenerate(_MESSAGES, {"type": "json_object"})) == {"ok": True}
+    assert len(_FakeAsyncOpenAI.instances) == 3
+
+
+def test_aclose_closes_the_client_and_releases_state(provider):
+    async def run():
+        await provider.agenerate(_MESSAGES, {"type": "json_object"})
+        await provider.aclose()
+        await provider.aclose()  # idempotent
+
+    asyncio.run(run())
+    assert _FakeAsyncOpenAI.instances[0].closed
+    assert provider._async_state is None
+
+
+def test_cache_requires_zero_temperature(provider):
+    with pytest.raises(ValueError):
+        provider_mod.OpenAIProvider(model="test-model", cache=provider_mod.LLMCache())
+    with pytest.raises(ValueError):
+        provider_mod.OpenAIProvider(model="test-model", cache=provider_mod.LLMCache(), temperature=0.7)
+
+
+def test_cached_reply_skips_the_network_and_temperature_is_sent(provider, monkeypatch):
+    sent = []
+    original = _Completions.create
+
+    async def create(self, **kwargs):
+        sent.append(kwargs)
+        return await original(self, **kwargs)
+
+    monkeypatch.setattr(_Completions, "create", create)
+    cached = provider_mod.OpenAIProvider(model="test-model", cache=provider_mod.LLMCache(), temperature=0)
+    for _ in range(2):
+        assert asyncio.run(cached.agenerate(_MESSAGES, {"type": "json_object"})) == {"ok": True}
+    assert len(sent) == 1
+    assert sent[0]["temperature"] == 0
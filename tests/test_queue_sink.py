@@ -0,0 +1,65 @@
+from __future__ import annotations
+"""`QueueTelemetrySink`: background delivery, ordering and shutdown."""
+import threading
+
+from src.adapters.telemetry.queue_sink import QueueTelemetrySink
+from src.core.types import TelemetryEvent
+from tests.fakes import ListSink
+
+
+class _BatchSink(ListSink):
+    """Inner sink exposing `record_many`; remembers each delivered batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list = []
+
+    def record_many(self, events) -> None:
+        batch = list(events)
+        self.batches.append(batch)
+        self.events.extend(batch)
+
+
+def _events(n: int, start: int = 0):
+    return [TelemetryEvent(interaction_id=f"i-{i}", stage="received") for i in range(start, start + n)]
+
+
+def test_events_recorded_before_close_are_delivered_in_order():
+    inner = ListSink()
+    sink = QueueTelemetrySink(inner)
+    events = _events(50)
+    for event in events:
+        sink.record(event)
+    sink.close()
+    assert inner.events == events
+
+
+def test_record_many_batches_are_flattened():
+    inner = _BatchSink()
+    sink = QueueTelemetrySink(inner)
+    first, second = _events(3), _events(2, start=3)
+    sink.record_many(first)
+    sink.record(_events(1, start=5)[0])
+    sink.record_many(second)
+    sink.close()
+    assert [e.interaction_id for e in inner.events] == ["i-0", "i-1", "i-2", "i-5", "i-3", "i-4"]
+    assert all(isinstance(e, TelemetryEvent) for batch in inner.batches for e in batch)
+
+
+def test_close_returns_after_the_writer_drains_and_is_idempotent():
+    release = threading.Event()
+
+    class _SlowSink(ListSink):
+        def record(self, event) -> None:
+            release.wait(timeout=5)
+            super().record(event)
+
+    inner = _SlowSink()
+    sink = QueueTelemetrySink(inner)
+    sink.record(_events(1)[0])
+    release.set()
+    sink.close()
+    assert not sink._thread.is_alive()
+    assert len(inner.events) == 1
+    sink.close()
+
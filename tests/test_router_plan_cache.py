@@ -0,0 +1,49 @@
+from __future__ import annotations
+"""Plan cache of `AgentRouter`: reuse, FIFO eviction and disabling."""
+from src.adapters.planner.simple_planner import SimplePlanner
+from tests.fakes import build_router, interaction
+
+
+class _CountingPlanner(SimplePlanner):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def plan(self, intent, interaction, params):
+        self.calls += 1
+        return super().plan(intent, interaction, params)
+
+
+def _router(**kwargs):
+    planner = _CountingPlanner()
+    # Response cache off so every turn reaches the planner step.
+    router, _, _ = build_router(response_cache_size=0, **kwargs)
+    router.planner = planner
+    return router, planner
+
+
+def test_same_intent_and_params_reuse_the_plan():
+    router, planner = _router()
+    router.handle(interaction("order O-1", "s-1"))
+    router.handle(interaction("order O-1", "s-2"))
+    assert planner.calls == 1
+
+
+def test_oldest_plan_is_evicted_first_even_if_recently_used():
+    router, planner = _router(plan_cache_size=2)
+    for text in ("order O-1", "order O-2", "order O-1"):
+        router.handle(interaction(text))
+    assert planner.calls == 2
+    router.handle(interaction("order O-3"))  # evicts O-1, the first inserted
+    assert planner.calls == 3
+    router.handle(interaction("order O-2"))
+    assert planner.calls == 3
+    router.handle(interaction("order O-1"))
+    assert planner.calls == 4
+
+
+def test_zero_size_disables_plan_cache():
+    router, planner = _router(plan_cache_size=0)
+    router.handle(interaction("order O-1"))
+    router.handle(interaction("order O-1"))
+    assert planner.calls == 2
@@ -0,0 +1,65 @@
+from __future__ import annotations
+"""Order prefetch in `AgentRouter.handle` / `ahandle`."""
+import asyncio
+import time
+
+from src.core.types import ToolResult
+from tests.fakes import RegexClassifier, build_router, interaction
+
+
+class _OtherOrderClassifier(RegexClassifier):
+    """Classifies as order status but extracts a different id than the text's."""
+
+    def classify(self, interaction, intents, history):
+        intent, _ = super().classify(interaction, intents, history)
+        return intent, {"order_id": "O-99999"}
+
+
+def _slow_async_tool(calls: list):
+    """Async order lookup taking 0.2s; appends each order id to `calls`."""
+
+    async def lookup(params: dict) -> ToolResult:
+        calls.append(params["order_id"])
+        await asyncio.sleep(0.2)
+        return ToolResult(ok=True, data={"order_id": params["order_id"], "status": "shipped"})
+
+    return lookup
+
+
+def test_handle_uses_prefetched_result():
+    router, sink, tool = build_router(prefetch_orders=True, response_cache_size=0)
+    response = router.handle(interaction("Where is my order O-12345?"))
+    assert response["tool_result"].data["order_id"] == "O-12345"
+    assert tool.calls == 1
+    assert sink.stages().count("tool_execute") == 1
+
+
+def test_ahandle_uses_prefetched_result():
+    router, _, tool = build_router(prefetch_orders=True, response_cache_size=0)
+    response = asyncio.run(router.ahandle(interaction("Where is my order O-12345?")))
+    assert response["tool_result"].data["order_id"] == "O-12345"
+    assert tool.calls == 1
+
+
+def test_prefetch_for_a_different_call_is_not_used():
+    router, _, tool = build_router(prefetch_orders=True, response_cache_size=0)
+    router.classifier = _OtherOrderClassifier()
+    response = asyncio.run(router.ahandle(interaction("Where is my order O-12345?")))
+    assert response["tool_result"].data["order_id"] == "O-99999"
+    assert "O-99999" in tool.order_ids
+
+
+def test_concurrent_ahandle_prefetches_overlap():
+    calls: list = []
+    router, _, _ = build_router(tool=_slow_async_tool(calls), prefetch_orders=True, response_cache_size=0)
+
+    async def run():
+        turns = [router.ahandle(interaction("order O-12345", f"s-{n}", f"i-{n}")) for n in range(10)]
+        return await asyncio.gather(*turns)
+
+    start = time.perf_counter()
+    responses = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    assert all(r["tool_result"].ok for r in responses)
+    assert len(calls) == 10
+    assert elapsed < 0.6
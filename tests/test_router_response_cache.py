@@ -0,0 +1,74 @@
+from __future__ import annotations
+"""Response cache behavior of `AgentRouter`: hits, expiry, eviction and policy."""
+import src.agent.router as router_mod
+from tests.fakes import OwnerOnlyPolicy, build_router, interaction
+
+
+def test_repeat_request_is_served_from_cache():
+    router, sink, tool = build_router()
+    first = router.handle(interaction("Where is my order O-12345?", "s-1"))
+    second = router.handle(interaction("Where is my order O-12345?", "s-2"))
+    assert second["text"] == first["text"]
+    assert tool.calls == 1
+    assert "cache_hit" in sink.stages()
+
+
+def test_expired_entry_is_recomputed(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(router_mod.time, "monotonic", lambda: now[0])
+    router, sink, tool = build_router(response_cache_ttl=30.0)
+    router.handle(interaction("Where is my order O-12345?"))
+    now[0] += 31.0
+    router.handle(interaction("Where is my order O-12345?"))
+    assert tool.calls == 2
+    assert "cache_hit" not in sink.stages()
+
+
+def test_least_recently_used_entry_is_evicted():
+    router, _, tool = build_router(response_cache_size=1)
+    router.handle(interaction("order O-12345"))
+    router.handle(interaction("order O-99999"))
+    router.handle(interaction("order O-99999"))
+    assert tool.calls == 2
+    router.handle(interaction("order O-12345"))
+    assert tool.calls == 3
+
+
+def test_cache_hit_rechecks_policy_for_the_caller():
+    router, sink, tool = build_router(policy=OwnerOnlyPolicy())
+    owner = router.handle(interaction("Where is my order O-12345?", "owner"))
+    assert owner["tool_result"].ok
+    stranger = router.handle(interaction("Where is my order O-12345?", "stranger"))
+    assert "tool_result" not in stranger or stranger["tool_result"] is None
+    assert "isn’t allowed by policy" in stranger["text"]
+    assert "C-1" not in stranger["text"]
+    assert "cache_hit" not in sink.stages()
+    assert tool.calls == 1
+
+
+def test_zero_size_disables_cache():
+    router, sink, tool = build_router(response_cache_size=0)
+    router.handle(interaction("order O-12345"))
+    router.handle(interaction("order O-12345"))
+    assert tool.calls == 2
+    assert "cache_hit" not in sink.stages()
+
+
+class _CountingPolicy(OwnerOnlyPolicy):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def validate(self, call, interaction, history):
+        self.calls += 1
+        return super().validate(call, interaction, history)
+
+
+def test_denied_cache_hit_checks_policy_once_per_turn():
+    policy = _CountingPolicy()
+    router, sink, _ = build_router(policy=policy)
+    router.handle(interaction("Where is my order O-12345?", "owner", "i-owner"))
+    policy.calls = 0
+    router.handle(interaction("Where is my order O-12345?", "stranger", "i-stranger"))
+    stranger_stages = [e.stage for e in sink.events if e.interaction_id == "i-stranger"]
+    assert stranger_stages.count("policy_check") == 1
+    assert policy.calls == 1
@@ -0,0 +1,79 @@
+from __future__ import annotations
+"""`SemanticCacheClassifier` hit/miss rules around extracted params."""
+import asyncio
+import re
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.adapters.classifier.semantic_cache import SemanticCacheClassifier
+from src.adapters.intents.yaml_registry import YAMLIntentsRegistry
+from tests.fakes import ROOT, RegexClassifier, interaction
+
+_VOCAB = ("where", "is", "my", "order")
+
+
+def _bag_of_words(text: str):
+    """Embedding that ignores order ids, so messages differing only by id collide."""
+    words = re.findall(r"[a-z]+", re.sub(r"\bO-\d+\b", "", text).lower())
+    return [float(words.count(w)) for w in _VOCAB] + [1.0]
+
+
+class _CountingClassifier(RegexClassifier):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def classify(self, interaction, intents, history):
+        self.calls += 1
+        return super().classify(interaction, intents, history)
+
+
+@pytest.fixture
+def setup():
+    inner = _CountingClassifier()
+    cache = SemanticCacheClassifier(inner, encoder=_bag_of_words, threshold=0.99)
+    intents = YAMLIntentsRegistry(ROOT / "config" / "intents.yaml").get_eligible({"channel": "chat"})
+    return cache, inner, intents
+
+
+def test_paraphrase_with_same_order_id_hits(setup):
+    cache, inner, intents = setup
+    cache.classify(interaction("where is my order O-12345"), intents, [])
+    intent, params = cache.classify(interaction("Where is my order O-12345?"), intents, [])
+    assert intent["id"] == "order_status"
+    assert params == {"order_id": "O-12345"}
+    assert inner.calls == 1
+
+
+def test_cached_id_that_is_a_prefix_of_the_new_id_misses(setup):
+    cache, inner, intents = setup
+    cache.classify(interaction("where is my order O-1"), intents, [])
+    _, params = cache.classify(interaction("where is my order O-12345"), intents, [])
+    assert params == {"order_id": "O-12345"}
+    assert inner.calls == 2
+
+
+def test_new_message_with_an_id_the_cached_decision_lacks_misses(setup):
+    cache, inner, intents = setup
+    cache.classify(interaction("where is my order"), intents, [])
+    _, params = cache.classify(interaction("where is my order O-99999"), intents, [])
+    assert params == {"order_id": "O-99999"}
+    assert inner.calls == 2
+
+
+def test_aclassify_runs_the_encoder_off_the_event_loop(setup):
+    _, inner, intents = setup
+    on_loop = []
+
+    def encoder(text):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return _bag_of_words(text)
+
+    cache = SemanticCacheClassifier(inner, encoder=encoder, threshold=0.99)
+    asyncio.run(cache.aclassify(interaction("where is my order O-12345"), intents, []))
+    assert on_loop == [False]